@@ -1,13 +1,136 @@
-import math
+import asyncio
 import os
 import re
-import xml.etree.ElementTree as ET
+from collections import Counter
+from functools import lru_cache
 from typing import Any
 
 import aiohttp
-from svgpathtools import parse_path
+import numpy as np
+from lxml import etree
+from svgpathtools import CubicBezier, Line, QuadraticBezier, parse_path
+
+from app.handwriting.synthesizer import Stroke, StrokeData, get_synthesizer
+
+# Hot-path regexes compiled once at import.  _estimate_target_height runs per
+# write action and _parse_transform per SVG node, so per-call re.compile
+# (hidden inside re.findall / re.split) adds up fast.
+_COMPLEXITY_RE = re.compile(
+    r"\\(begin\{[pb]?matrix\}|dfrac|tfrac|frac|sqrt|int|sum|prod|lim|left|right)"
+)
+_COMPLEXITY_WEIGHTS = {
+    "frac": 2.0,
+    "dfrac": 2.0,
+    "tfrac": 1.5,
+    "sqrt": 1.4,
+    "int": 1.8,
+    "sum": 1.8,
+    "prod": 1.8,
+    "lim": 1.2,
+    "begin{matrix}": 2.4,
+    "begin{pmatrix}": 2.4,
+    "begin{bmatrix}": 2.4,
+    "left": 1.0,
+    "right": 1.0,
+}
+_FRAC_PLAIN_RE = re.compile(r"\\frac\s*\{([^{}]+)\}\s*\{([^{}]+)\}")
+_SQRT_PLAIN_RE = re.compile(r"\\sqrt\s*\{([^{}]+)\}")
+_CMD_PLAIN_RE = re.compile(r"\\([a-zA-Z]+)")
+_WS_RE = re.compile(r"\s+")
+
+_EMPTY_PTS = np.empty((0, 2))
+_EMPTY_PTS.flags.writeable = False
+
+# Namespace-qualified tag names built once at import — _extract_contours
+# compares tags for every node it visits, and the unqualified variants keep
+# working for the rare non-namespaced SVG.
+_SVG_NS = "{http://www.w3.org/2000/svg}"
+_PATH_TAG = f"{_SVG_NS}path"
+_USE_TAG = f"{_SVG_NS}use"
+_DEFS_TAGS = (f"{_SVG_NS}defs", "defs")
+_XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+
+
+def _approx_segment_length(seg) -> float:
+    """
+    Cheap segment-length estimate: average of the chord and the control
+    polygon. The length is only used to budget sample counts, so the
+    adaptive integrator svgpathtools runs inside seg.length() is overkill.
+    """
+    if isinstance(seg, Line):
+        return abs(seg.end - seg.start)
+    if isinstance(seg, QuadraticBezier):
+        poly = abs(seg.control - seg.start) + abs(seg.end - seg.control)
+        return 0.5 * (poly + abs(seg.end - seg.start))
+    if isinstance(seg, CubicBezier):
+        poly = (
+            abs(seg.control1 - seg.start)
+            + abs(seg.control2 - seg.control1)
+            + abs(seg.end - seg.control2)
+        )
+        return 0.5 * (poly + abs(seg.end - seg.start))
+    return seg.length(error=1e-2)
+
+
+@lru_cache(maxsize=4096)
+def _sample_svg_path(path_d: str) -> np.ndarray:
+    """
+    Sample evenly-spaced points along an SVG path string.
+
+    Returns a read-only (N, 2) float array.  Each segment's Bezier polynomial
+    is evaluated on a whole t-vector at once (complex arithmetic for the 2D
+    points), so the cost per point is a few NumPy ops instead of a Python
+    `path.point(t)` call that redoes segment lookup every time.
 
-from app.handwriting.synthesizer import HandwritingSynthesizer, Stroke, StrokeData, StrokePoint
+    MathJax emits one path per glyph and reuses the same `d` strings across
+    expressions, so this cache turns repeat glyphs into a dict lookup.
+    """
+    try:
+        path = parse_path(path_d)
+    except Exception:
+        return _EMPTY_PTS
+
+    if len(path) == 0:
+        return _EMPTY_PTS
+
+    seg_lens = [_approx_segment_length(seg) for seg in path]
+    total_len = sum(seg_lens)
+    if total_len <= 0:
+        return _EMPTY_PTS
+
+    num_points = max(12, min(220, int(total_len / 3.0)))
+
+    pieces: list[np.ndarray] = []
+    for seg, seg_len in zip(path, seg_lens):
+        # Allocate samples proportional to this segment's share of length.
+        n = max(1, int(round(num_points * seg_len / total_len)))
+        t = np.linspace(0.0, 1.0, n + 1)
+
+        if isinstance(seg, Line):
+            pts = seg.start + t * (seg.end - seg.start)
+        elif isinstance(seg, QuadraticBezier):
+            mt = 1.0 - t
+            pts = mt * mt * seg.start + 2.0 * mt * t * seg.control + t * t * seg.end
+        elif isinstance(seg, CubicBezier):
+            mt = 1.0 - t
+            pts = (
+                mt * mt * mt * seg.start
+                + 3.0 * mt * mt * t * seg.control1
+                + 3.0 * mt * t * t * seg.control2
+                + t * t * t * seg.end
+            )
+        else:
+            # Arcs and other segment types are rare in MathJax output;
+            # fall back to per-point evaluation for them.
+            pts = np.array([seg.point(tv) for tv in t])
+
+        # Drop the duplicated joint point between consecutive segments.
+        pieces.append(pts if not pieces else pts[1:])
+
+    arr = np.concatenate(pieces)
+    out = np.stack([arr.real, arr.imag], axis=1)
+    out.flags.writeable = False  # cached value is shared between callers
+    return out
 
 
 class LaTeXToStrokes:
@@ -18,13 +141,47 @@ class LaTeXToStrokes:
       LaTeX → MathJax server-side SVG → extract <path d="..."> → sample points → StrokeData
     """
 
+    # Bounded FIFO caches — repeated expressions are the common case when the
+    # tutor rewrites or references the same equation across turns.
+    _CACHE_MAX = 512
+
     def __init__(self):
         self.mathjax_url = os.getenv("LATEX_RENDER_URL", "http://localhost:3001/mathjax")
-        self._fallback_writer = HandwritingSynthesizer()
+        self._fallback_writer = get_synthesizer()
         # Base/limits for adaptive LaTeX sizing to match nearby handwriting.
         self._target_height_px = float(os.getenv("LATEX_TARGET_HEIGHT_PX", "70"))
         self._target_height_min_px = float(os.getenv("LATEX_TARGET_HEIGHT_MIN_PX", "54"))
         self._target_height_max_px = float(os.getenv("LATEX_TARGET_HEIGHT_MAX_PX", "110"))
+        # latex → rendered SVG (skips the MathJax round-trip on repeats)
+        self._svg_cache: dict[str, str] = {}
+        # svg text → (concatenated sampled points, contour lengths, min_xy, max_xy);
+        # position/scale are applied per call, so one entry serves any placement.
+        self._contour_cache: dict[str, tuple[np.ndarray, list[int], np.ndarray, np.ndarray]] = {}
+        # One pooled HTTP session per converter — keep-alive to the MathJax
+        # renderer instead of a fresh TCP handshake per expression.
+        self._session: aiohttp.ClientSession | None = None
+        self._session_lock = asyncio.Lock()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            async with self._session_lock:
+                if self._session is None or self._session.closed:
+                    self._session = aiohttp.ClientSession(
+                        timeout=aiohttp.ClientTimeout(total=8)
+                    )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the pooled MathJax session. Call when the owning session ends."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @classmethod
+    def _cache_put(cls, cache: dict, key, value) -> None:
+        if len(cache) >= cls._CACHE_MAX:
+            cache.pop(next(iter(cache)))  # FIFO eviction
+        cache[key] = value
 
     async def convert(
         self,
@@ -49,41 +206,93 @@ class LaTeXToStrokes:
         if not svg:
             return self._fallback(latex, color, position)
 
-        strokes = self._svg_to_strokes(
-            svg,
-            color,
-            position,
-            latex=latex,
-            max_width_px=max_width_px,
+        # Path parsing/sampling is pure CPU — run it off the event loop so a
+        # burst of renders doesn't stall audio/transcript traffic.
+        strokes = await asyncio.get_running_loop().run_in_executor(
+            None,
+            lambda: self._svg_to_strokes(
+                svg,
+                color,
+                position,
+                latex=latex,
+                max_width_px=max_width_px,
+            ),
         )
         if not strokes:
             return self._fallback(latex, color, position)
 
         return StrokeData(strokes=strokes, position=position, animation_speed=1.0)
 
+    async def prewarm(self, latexes: list[str]) -> None:
+        """
+        Render several expressions with one MathJax round-trip.
+
+        N convert() calls pay N round-trips to the renderer; pre-warming the
+        SVG cache with one batched POST first means the subsequent convert()
+        calls all hit the cache, so a multi-equation response costs ~1 RTT.
+        """
+        await self._render_svg_batch(latexes)
+
+    async def _render_svg_batch(self, latexes: list[str]) -> None:
+        """Render every uncached expression in one batched POST."""
+        # Dedupe while preserving order; repeats within a batch are common
+        # when the tutor writes the same sub-expression on several lines.
+        pending = list(dict.fromkeys(l for l in latexes if l and l not in self._svg_cache))
+        if not pending:
+            return
+
+        payload = {"items": [{"latex": latex, "display": True} for latex in pending]}
+        try:
+            session = await self._get_session()
+            async with session.post(self.mathjax_url, json=payload) as resp:
+                resp.raise_for_status()
+                data: Any = await resp.json()
+        except Exception as exc:
+            # Older renderers without batch support (or transport errors):
+            # leave the cache cold and let convert() fall back to per-item posts.
+            print(f"[LaTeX] MathJax batch render failed: {exc}")
+            return
+
+        results = data.get("results") if isinstance(data, dict) else None
+        if not isinstance(results, list):
+            return
+        for latex, result in zip(pending, results):
+            svg = result.get("svg") if isinstance(result, dict) else None
+            if isinstance(svg, str) and svg:
+                self._cache_put(self._svg_cache, latex, svg)
+
     async def _render_svg(self, latex: str) -> str:
+        cached = self._svg_cache.get(latex)
+        if cached is not None:
+            return cached
+
         payload = {
             "latex": latex,
             "display": True,
         }
 
-        timeout = aiohttp.ClientTimeout(total=8)
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(self.mathjax_url, json=payload) as resp:
-                    resp.raise_for_status()
-                    ctype = (resp.headers.get("Content-Type") or "").lower()
-                    if "application/json" in ctype:
-                        data: Any = await resp.json()
-                        if isinstance(data, dict):
-                            svg = data.get("svg")
-                            if isinstance(svg, str):
-                                return svg
-                    return await resp.text()
+            session = await self._get_session()
+            async with session.post(self.mathjax_url, json=payload) as resp:
+                resp.raise_for_status()
+                ctype = (resp.headers.get("Content-Type") or "").lower()
+                svg_text = ""
+                if "application/json" in ctype:
+                    data: Any = await resp.json()
+                    if isinstance(data, dict):
+                        svg = data.get("svg")
+                        if isinstance(svg, str):
+                            svg_text = svg
+                if not svg_text:
+                    svg_text = await resp.text()
         except Exception as exc:
             print(f"[LaTeX] MathJax render failed: {exc}")
             return ""
 
+        if svg_text:
+            self._cache_put(self._svg_cache, latex, svg_text)
+        return svg_text
+
     def _svg_to_strokes(
         self,
         svg_text: str,
@@ -92,60 +301,19 @@ class LaTeXToStrokes:
         latex: str = "",
         max_width_px: float | None = None,
     ) -> list[Stroke]:
-        try:
-            root = ET.fromstring(svg_text)
-        except Exception as exc:
-            print(f"[LaTeX] SVG parse failed: {exc}")
-            return []
-
-        path_entries: list[tuple[str, tuple[float, float, float, float, float, float]]] = []
-
-        def walk(node: ET.Element, transform: tuple[float, float, float, float, float, float]) -> None:
-            node_transform = self._parse_transform(node.attrib.get("transform", ""))
-            current = self._mul_affine(transform, node_transform)
-
-            if self._strip_ns(node.tag) == "path":
-                d = node.attrib.get("d", "")
-                if d:
-                    path_entries.append((d, current))
-
-            for child in list(node):
-                walk(child, current)
-
-        walk(root, (1.0, 0.0, 0.0, 1.0, 0.0, 0.0))
-        if not path_entries:
-            return []
+        # Parsing + sampling is position-independent, so cache it and only
+        # re-apply scale/offset for each placement of the same SVG.
+        cached = self._contour_cache.get(svg_text)
+        if cached is None:
+            cached = self._extract_contours(svg_text)
+            if cached is None:
+                return []
+            self._cache_put(self._contour_cache, svg_text, cached)
 
-        sampled: list[list[tuple[float, float]]] = []
-        min_x = float("inf")
-        min_y = float("inf")
-        max_x = float("-inf")
-        max_y = float("-inf")
+        all_pts, lengths, min_xy, max_xy = cached
 
-        for d, affine in path_entries:
-            pts = self._sample_svg_path(d)
-            if len(pts) < 2:
-                continue
-
-            transformed = [self._apply_affine(x, y, affine) for x, y in pts]
-            for x, y in transformed:
-                min_x = min(min_x, x)
-                min_y = min(min_y, y)
-                max_x = max(max_x, x)
-                max_y = max(max_y, y)
-            sampled.append(transformed)
-
-        if (
-            not sampled
-            or not math.isfinite(min_x)
-            or not math.isfinite(min_y)
-            or not math.isfinite(max_x)
-            or not math.isfinite(max_y)
-        ):
-            return []
-
-        src_w = max(1.0, max_x - min_x)
-        src_h = max(1.0, max_y - min_y)
+        src_w = max(1.0, float(max_xy[0] - min_xy[0]))
+        src_h = max(1.0, float(max_xy[1] - min_xy[1]))
 
         # Primary normalization: adaptive equation height based on expression complexity.
         target_height = self._estimate_target_height(latex)
@@ -157,24 +325,127 @@ class LaTeXToStrokes:
             if scaled_w > max_width_px:
                 scale *= max_width_px / scaled_w
 
-        off_x = float(position.get("x", 100))
-        off_y = float(position.get("y", 100))
+        off_xy = np.array([float(position.get("x", 100)), float(position.get("y", 100))])
+
+        # Normalize + offset every contour in one fused pass over a single
+        # concatenated array, then slice back per contour.
+        placed = (all_pts - min_xy) * scale + off_xy
 
         strokes: list[Stroke] = []
-        for contour in sampled:
-            points = [
-                StrokePoint(
-                    x=off_x + (x - min_x) * scale,
-                    y=off_y + (y - min_y) * scale,
-                    pressure=0.75,
-                )
-                for x, y in contour
-            ]
-            if len(points) >= 2:
-                strokes.append(Stroke(points=points, color=color, width=2.0))
+        for contour in np.split(placed, np.cumsum(lengths)[:-1]):
+            if len(contour) < 2:
+                continue
+            pts = np.empty((len(contour), 3), dtype=np.float32)
+            pts[:, :2] = contour
+            pts[:, 2] = 0.75
+            strokes.append(Stroke(points=pts, color=color, width=2.0))
 
         return strokes
 
+    def _extract_contours(
+        self, svg_text: str
+    ) -> tuple[np.ndarray, list[int], np.ndarray, np.ndarray] | None:
+        """
+        Parse the SVG and sample every path into world-space points.
+
+        Returns (concatenated points, per-contour lengths, min_xy, max_xy),
+        or None when the SVG has no drawable content.
+        """
+        try:
+            root = etree.fromstring(svg_text.encode())
+        except Exception as exc:
+            print(f"[LaTeX] SVG parse failed: {exc}")
+            return None
+
+        # Enumerate <path> elements directly in C instead of recursing over
+        # MathJax's deeply nested <g> tree in Python. Cumulative transforms
+        # are built along each path's ancestor chain and memoized per node,
+        # so shared ancestors are multiplied only once. The memo is keyed by
+        # the element proxy itself, NOT id(node): the dict entry keeps the
+        # proxy alive, which both stabilizes the key (lxml recycles ids of
+        # collected proxies) and makes lxml hand back the same live proxy for
+        # a given underlying node, so ancestor lookups actually hit.
+        identity = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+        xform_cache: dict[object, tuple[float, float, float, float, float, float]] = {}
+
+        def cumulative_transform(node) -> tuple[float, float, float, float, float, float]:
+            cached = xform_cache.get(node)
+            if cached is not None:
+                return cached
+            parent = node.getparent()
+            parent_t = cumulative_transform(parent) if parent is not None else identity
+            t = self._mul_affine(parent_t, self._parse_transform(node.get("transform") or ""))
+            xform_cache[node] = t
+            return t
+
+        # Single document-order pass over <path> and <use>.  With a font
+        # cache enabled MathJax defines each glyph once under <defs> and
+        # references it via <use>, so resolve ids to their d strings and emit
+        # one entry per instance with only the per-instance transform.
+        # <defs> precedes all references in MathJax output.
+        defs_paths: dict[str, str] = {}
+        path_entries: list[tuple[str, tuple[float, float, float, float, float, float]]] = []
+
+        for el in root.iter(_PATH_TAG, "path", _USE_TAG, "use"):
+            if el.tag.endswith("path"):
+                d = el.get("d") or ""
+                if not d:
+                    continue
+                pid = el.get("id")
+                if pid:
+                    defs_paths[pid] = d
+                if not any(anc.tag in _DEFS_TAGS for anc in el.iterancestors()):
+                    path_entries.append((d, cumulative_transform(el)))
+            else:
+                href = el.get(_XLINK_HREF) or el.get("href") or ""
+                d = defs_paths.get(href.lstrip("#"))
+                if not d:
+                    continue
+                t = cumulative_transform(el)
+                ux = float(el.get("x") or 0.0)
+                uy = float(el.get("y") or 0.0)
+                if ux or uy:
+                    t = self._mul_affine(t, (1.0, 0.0, 0.0, 1.0, ux, uy))
+                path_entries.append((d, t))
+
+        if not path_entries:
+            return None
+
+        sampled: list[np.ndarray] = []
+        mins: list[np.ndarray] = []
+        maxs: list[np.ndarray] = []
+
+        for d, affine in path_entries:
+            pts = _sample_svg_path(d)
+            if len(pts) < 2:
+                continue
+
+            # Apply the affine as one homogeneous-coordinate matmul over the
+            # whole path instead of a per-point helper call.
+            a, b, c, d_, e, f = affine
+            m = np.array([[a, c, e], [b, d_, f]])
+            pts_h = np.hstack([pts, np.ones((len(pts), 1))])
+            transformed = pts_h @ m.T
+
+            sampled.append(transformed)
+            mins.append(transformed.min(axis=0))
+            maxs.append(transformed.max(axis=0))
+
+        if not sampled:
+            return None
+
+        # One reduction over the per-contour extrema instead of running
+        # minimum/maximum accumulators inside the loop.
+        min_xy = np.min(np.stack(mins), axis=0)
+        max_xy = np.max(np.stack(maxs), axis=0)
+        if not np.isfinite(min_xy).all() or not np.isfinite(max_xy).all():
+            return None
+
+        lengths = [len(c) for c in sampled]
+        all_pts = np.concatenate(sampled)
+        all_pts.flags.writeable = False  # shared across cache hits
+        return all_pts, lengths, min_xy, max_xy
+
     def _estimate_target_height(self, latex: str) -> float:
         """
         Heuristic sizing:
@@ -183,26 +454,12 @@ class LaTeXToStrokes:
           so they remain legible without user zoom.
         """
         text = latex or ""
-        complexity = 0
-
-        # Structural commands with higher visual density.
-        weighted_tokens = [
-            (r"\\frac", 2.0),
-            (r"\\dfrac", 2.0),
-            (r"\\tfrac", 1.5),
-            (r"\\sqrt", 1.4),
-            (r"\\int", 1.8),
-            (r"\\sum", 1.8),
-            (r"\\prod", 1.8),
-            (r"\\lim", 1.2),
-            (r"\\begin\{matrix\}", 2.4),
-            (r"\\begin\{pmatrix\}", 2.4),
-            (r"\\begin\{bmatrix\}", 2.4),
-            (r"\\left", 1.0),
-            (r"\\right", 1.0),
-        ]
-        for pattern, weight in weighted_tokens:
-            complexity += len(re.findall(pattern, text)) * weight
+        complexity = 0.0
+
+        # Structural commands with higher visual density — one combined
+        # alternation scan instead of 13 separate findall passes.
+        for token, count in Counter(_COMPLEXITY_RE.findall(text)).items():
+            complexity += _COMPLEXITY_WEIGHTS.get(token, 1.0) * count
 
         # Penalize deep superscript/subscript usage.
         complexity += text.count("^") * 0.45
@@ -216,52 +473,63 @@ class LaTeXToStrokes:
         height = self._target_height_px + complexity * 2.2 - 4.0
         return min(self._target_height_max_px, max(self._target_height_min_px, height))
 
-    def _sample_svg_path(self, path_d: str) -> list[tuple[float, float]]:
-        """Sample evenly-spaced points along an SVG path string."""
-        try:
-            path = parse_path(path_d)
-        except Exception:
-            return []
-
-        total_len = path.length(error=1e-4)
-        num_points = max(12, min(220, int(total_len / 3.0)))
-        points: list[tuple[float, float]] = []
-        for i in range(num_points + 1):
-            t = i / num_points
-            pt = path.point(t)
-            points.append((float(pt.real), float(pt.imag)))
-        return points
-
     def _fallback(self, latex: str, color: str, position: dict) -> StrokeData:
         plain = self._latex_to_plain(latex)
         return self._fallback_writer.synthesize(plain, color=color, position=position)
 
     def _latex_to_plain(self, text: str) -> str:
         out = text.strip()
-        out = re.sub(r"\\frac\s*\{([^{}]+)\}\s*\{([^{}]+)\}", r"(\1)/(\2)", out)
-        out = re.sub(r"\\sqrt\s*\{([^{}]+)\}", r"sqrt(\1)", out)
-        out = re.sub(r"\\([a-zA-Z]+)", r"\1", out)
+        out = _FRAC_PLAIN_RE.sub(r"(\1)/(\2)", out)
+        out = _SQRT_PLAIN_RE.sub(r"sqrt(\1)", out)
+        out = _CMD_PLAIN_RE.sub(r"\1", out)
         out = out.replace("{", "(").replace("}", ")")
         out = out.replace("^", " ^ ").replace("_", " _ ")
-        out = re.sub(r"\s+", " ", out).strip()
+        out = _WS_RE.sub(" ", out).strip()
         return out or "math"
 
-    def _strip_ns(self, tag: str) -> str:
-        return tag.rsplit("}", 1)[-1]
-
     def _parse_transform(self, transform: str) -> tuple[float, float, float, float, float, float]:
-        if not transform.strip():
-            return (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
-
+        """
+        Single-pass scanner over the transform attribute — nearly every <g>
+        in MathJax output carries one, so this avoids two regex passes and
+        their intermediate lists per node.
+        """
         current = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
-        for fn, arg_str in re.findall(r"([a-zA-Z]+)\(([^)]*)\)", transform):
-            nums = [
-                float(x)
-                for x in re.split(r"[,\s]+", arg_str.strip())
-                if x.strip()
-            ]
+        if not transform:
+            return current
+
+        i = 0
+        length = len(transform)
+        while i < length:
+            if not transform[i].isalpha():
+                i += 1
+                continue
+
+            start = i
+            while i < length and transform[i].isalpha():
+                i += 1
+            fn = transform[start:i]
+
+            while i < length and transform[i] != "(":
+                i += 1
+            if i >= length:
+                break
+            i += 1  # skip "("
+
+            start = i
+            while i < length and transform[i] != ")":
+                i += 1
+            arg_str = transform[start:i]
+            i += 1  # skip ")"
+
+            nums: list[float] = []
+            for tok in arg_str.replace(",", " ").split():
+                try:
+                    nums.append(float(tok))
+                except ValueError:
+                    pass
+
             if fn == "matrix" and len(nums) == 6:
-                m = tuple(nums)  # type: ignore[assignment]
+                m = (nums[0], nums[1], nums[2], nums[3], nums[4], nums[5])
             elif fn == "translate":
                 tx = nums[0] if len(nums) >= 1 else 0.0
                 ty = nums[1] if len(nums) >= 2 else 0.0
@@ -290,12 +558,3 @@ class LaTeXToStrokes:
             a0 * b4 + a2 * b5 + a4,
             a1 * b4 + a3 * b5 + a5,
         )
-
-    def _apply_affine(
-        self,
-        x: float,
-        y: float,
-        t: tuple[float, float, float, float, float, float],
-    ) -> tuple[float, float]:
-        a, b, c, d, e, f = t
-        return (a * x + c * y + e, b * x + d * y + f)
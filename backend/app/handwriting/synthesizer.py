@@ -1,8 +1,9 @@
-import math
-import random
+import pickle
 import ssl
+import threading
 import urllib.request
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -17,9 +18,17 @@ _FONT_URL = (
 )
 _FONT_PATH = Path(__file__).parent / "PatrickHand-Regular.ttf"
 
+# Persisted glyph skeletons: skeletonization costs tens of ms per glyph, so
+# warm contours are written next to the font and shared by every worker
+# process via the OS page cache instead of being recomputed per process.
+_CONTOUR_CACHE_PATH = Path(__file__).parent / "PatrickHand-Regular.contours.pkl"
+
 # Visual cap height on the whiteboard canvas (px).
 _TARGET_CAP_HEIGHT_PX = 40
 
+# Sentinel distinguishing "never looked up" from a cached None (no glyph).
+_UNCACHED = object()
+
 # Oversample factor for rasterizing glyphs before skeletonizing.
 # Higher = smoother skeleton but more memory/time per glyph.
 _OVERSAMPLE = 4
@@ -28,21 +37,16 @@ _OVERSAMPLE = 4
 # ── Wire-format dataclasses (must match frontend StrokeData type) ─────────────
 
 
-@dataclass
-class StrokePoint:
-    x: float
-    y: float
-    pressure: float = 0.8
-
-
-@dataclass
+@dataclass(slots=True)
 class Stroke:
-    points: list[StrokePoint]
+    # Points are stored columnar: an (N, 3) float32 array of x, y, pressure.
+    # One array per stroke replaces thousands of per-point Python objects.
+    points: np.ndarray
     color: str = "#000000"
     width: float = 2.0
 
 
-@dataclass
+@dataclass(slots=True)
 class StrokeData:
     strokes: list[Stroke]
     position: dict  # {"x": float, "y": float}
@@ -53,8 +57,9 @@ class StrokeData:
             "strokes": [
                 {
                     "points": [
-                        {"x": p.x, "y": p.y, "pressure": p.pressure}
-                        for p in stroke.points
+                        {"x": x, "y": y, "pressure": p}
+                        # round() kills float32 representation noise in the JSON
+                        for x, y, p in stroke.points.astype(float).round(3).tolist()
                     ],
                     "color": stroke.color,
                     "width": stroke.width,
@@ -69,70 +74,104 @@ class StrokeData:
 # ── Bezier sampling helpers ────────────────────────────────────────────────────
 
 
-def _sample_quadratic(p0, p1, p2, n: int = 3) -> list[tuple]:
-    pts = []
-    for i in range(n + 1):
-        t = i / n
-        mt = 1 - t
-        x = mt * mt * p0[0] + 2 * mt * t * p1[0] + t * t * p2[0]
-        y = mt * mt * p0[1] + 2 * mt * t * p1[1] + t * t * p2[1]
-        pts.append((x, y))
-    return pts
+@lru_cache(maxsize=512)
+def _pressure_curve(n: int) -> np.ndarray:
+    """
+    Sine pressure curve for an n-point stroke: softer at the ends, full in
+    the middle. Contour lengths repeat across glyph instances, so the curve
+    is computed once per length and shared (read-only, pre-rounded for the
+    wire format).
+    """
+    p = np.round(0.35 + 0.65 * np.sin(np.pi * np.linspace(0.0, 1.0, n)), 3)
+    p.flags.writeable = False
+    return p
+
+
+@lru_cache(maxsize=16)
+def _quad_basis(n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bernstein basis vectors for a quadratic Bezier sampled at n+1 t-values."""
+    t = np.linspace(0.0, 1.0, n + 1)
+    mt = 1.0 - t
+    return mt * mt, 2.0 * mt * t, t * t
+
+
+@lru_cache(maxsize=16)
+def _cubic_basis(n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Bernstein basis vectors for a cubic Bezier sampled at n+1 t-values."""
+    t = np.linspace(0.0, 1.0, n + 1)
+    mt = 1.0 - t
+    return mt * mt * mt, 3.0 * mt * mt * t, 3.0 * mt * t * t, t * t * t
+
 
+def _sample_quadratic(p0: complex, p1: complex, p2: complex, n: int = 3) -> np.ndarray:
+    """Evaluate the quadratic Bezier on a cached basis; complex points in/out."""
+    b0, b1, b2 = _quad_basis(n)
+    return b0 * p0 + b1 * p1 + b2 * p2
 
-def _sample_cubic(p0, p1, p2, p3, n: int = 4) -> list[tuple]:
-    pts = []
-    for i in range(n + 1):
-        t = i / n
-        mt = 1 - t
-        x = mt**3 * p0[0] + 3 * mt**2 * t * p1[0] + 3 * mt * t**2 * p2[0] + t**3 * p3[0]
-        y = mt**3 * p0[1] + 3 * mt**2 * t * p1[1] + 3 * mt * t**2 * p2[1] + t**3 * p3[1]
-        pts.append((x, y))
-    return pts
+
+def _sample_cubic(p0: complex, p1: complex, p2: complex, p3: complex, n: int = 4) -> np.ndarray:
+    """Evaluate the cubic Bezier on a cached basis; complex points in/out."""
+    b0, b1, b2, b3 = _cubic_basis(n)
+    return b0 * p0 + b1 * p1 + b2 * p2 + b3 * p3
 
 
 # ── Convert RecordingPen value → list of contours ────────────────────────────
 
 
 def _recording_to_contours(value: list) -> list[list[tuple]]:
-    """Convert a RecordingPen value list into contours (lists of (x,y) font-unit points)."""
+    """
+    Convert a RecordingPen value list into contours (lists of (x,y) font-unit points).
+
+    Points are carried as complex internally: midpoints and Bezier evaluation
+    become single C-level complex ops instead of component-wise tuple math,
+    and only the finished contour is unpacked back to (x, y) tuples.
+    """
     contours: list[list[tuple]] = []
-    current: list[tuple] = []
+    current: list[complex] = []
+
+    def _close() -> None:
+        nonlocal current
+        if len(current) > 1:
+            contours.append([(p.real, p.imag) for p in current])
+        current = []
 
     for op, args in value:
         if op == "moveTo":
-            if len(current) > 1:
-                contours.append(current)
-            current = [args[0]]
+            _close()
+            current = [complex(*args[0])]
 
         elif op == "lineTo":
-            current.append(args[0])
+            current.append(complex(*args[0]))
 
         elif op == "qCurveTo":
-            pts = list(args)
+            pts = [complex(*a) for a in args]
             start = current[-1] if current else pts[0]
-            while len(pts) > 2:
-                p1 = pts[0]
-                p2 = ((pts[0][0] + pts[1][0]) / 2.0, (pts[0][1] + pts[1][1]) / 2.0)
-                current.extend(_sample_quadratic(start, p1, p2)[1:])
+            # Index cursor rather than pts.pop(0): popping the head shifts
+            # every remaining element, going quadratic on the long implied
+            # off-curve runs script fonts produce.
+            last = len(pts) - 2
+            for j in range(last):
+                p1 = pts[j]
+                p2 = (p1 + pts[j + 1]) * 0.5
+                current.extend(_sample_quadratic(start, p1, p2)[1:].tolist())
                 start = p2
-                pts.pop(0)
-            if len(pts) == 2:
-                current.extend(_sample_quadratic(start, pts[0], pts[1])[1:])
-            elif len(pts) == 1:
+            if len(pts) >= 2:
+                current.extend(_sample_quadratic(start, pts[-2], pts[-1])[1:].tolist())
+            elif pts:
                 current.append(pts[0])
 
         elif op == "curveTo":
-            p0 = current[-1] if current else args[0]
-            current.extend(_sample_cubic(p0, args[0], args[1], args[2])[1:])
+            p0 = current[-1] if current else complex(*args[0])
+            current.extend(
+                _sample_cubic(p0, complex(*args[0]), complex(*args[1]), complex(*args[2]))[
+                    1:
+                ].tolist()
+            )
 
         elif op in ("closePath", "endPath"):
-            if len(current) > 1:
-                contours.append(current)
-            current = []
+            _close()
 
-    if len(current) > 1:
-        contours.append(current)
+    _close()
 
     return contours
 
@@ -300,21 +339,110 @@ class HandwritingSynthesizer:
     The result looks like actual pen strokes rather than outlines of filled shapes.
     """
 
-    def __init__(self):
+    # Cache: glyph_name → (stroke paths as (N, 2) arrays in font-unit
+    # coordinates (y-up, baseline=0), advance width in font units).
+    # Class-level so every synthesizer instance (one per session) shares the
+    # skeletonization work for the single Patrick Hand font.
+    _skeleton_cache: dict[str, tuple[list[np.ndarray], float]] = {}
+    _skeleton_cache_loaded: bool = False
+    _skeleton_cache_persisted: int = 0
+    # Serializes disk writes of the cache — synthesize() runs on the
+    # orchestrator's handwriting pool, so two workers can finish new glyphs
+    # at the same time and would otherwise interleave writes into the same
+    # tmp file, producing a corrupt pickle.
+    _persist_lock = threading.Lock()
+
+    # codepoint → (paths, advance), or None for characters with no glyph.
+    # draw_char runs once per character of every response, so this collapses
+    # the cmap lookup + glyph-set membership test + skeleton fetch into a
+    # single dict hit after the first occurrence of each character.
+    _codepoint_cache: dict[int, tuple[list[np.ndarray], float] | None] = {}
+
+    @classmethod
+    def _load_skeleton_cache(cls) -> None:
+        """Seed the in-memory cache from the on-disk contour file, once."""
+        if cls._skeleton_cache_loaded:
+            return
+        cls._skeleton_cache_loaded = True
+        try:
+            with open(_CONTOUR_CACHE_PATH, "rb") as fh:
+                data = pickle.load(fh)
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            print(f"Glyph contour cache load failed ({exc}); recomputing.", flush=True)
+            return
+        if isinstance(data, dict):
+            for paths, _advance in data.values():
+                for arr in paths:
+                    arr.flags.writeable = False  # pickle restores arrays writable
+            cls._skeleton_cache.update(data)
+            cls._skeleton_cache_persisted = len(cls._skeleton_cache)
+
+    @classmethod
+    def _persist_skeleton_cache(cls) -> None:
+        """Write newly skeletonized glyphs back to disk (atomic replace)."""
+        if len(cls._skeleton_cache) == cls._skeleton_cache_persisted:
+            return
+        with cls._persist_lock:
+            # Re-check under the lock: a concurrent worker may have just
+            # persisted the same new glyphs.
+            if len(cls._skeleton_cache) == cls._skeleton_cache_persisted:
+                return
+            tmp_path = _CONTOUR_CACHE_PATH.with_suffix(".tmp")
+            try:
+                with open(tmp_path, "wb") as fh:
+                    pickle.dump(
+                        cls._skeleton_cache, fh, protocol=pickle.HIGHEST_PROTOCOL
+                    )
+                tmp_path.replace(_CONTOUR_CACHE_PATH)
+                cls._skeleton_cache_persisted = len(cls._skeleton_cache)
+            except Exception as exc:
+                print(f"Glyph contour cache write failed: {exc}", flush=True)
+
+    def __init__(self, jitter_seed: int | None = None):
         self._font: TTFont | None = None
         self._glyph_set = None
         self._cmap: dict | None = None
+        self._glyph_info: dict[int, tuple[str, float]] = {}
         self._scale: float = 1.0
         self._cap_height_units: int = 700
-        # Cache: glyph_name → list of paths in font-unit coordinates (y-up, baseline=0)
-        self._skeleton_cache: dict[str, list[list[tuple[float, float]]]] = {}
+        # Per-instance PCG64 generator for pen-jitter; seedable so a session's
+        # handwriting can be made reproducible.
+        self._rng = np.random.default_rng(jitter_seed)
 
     # ── Font loading ──────────────────────────────────────────────────────────
 
+    # Parsed font shared by every instance: TTFont() + getBestCmap() cost tens
+    # of ms, and a synthesizer is created per session (plus one inside the
+    # LaTeX fallback), so the parse should happen once per process.
+    _font_lock = threading.Lock()
+    _shared_font: TTFont | None = None
+    _shared_glyph_set = None
+    _shared_cmap: dict = {}
+    _shared_glyph_info: dict[int, tuple[str, float]] = {}
+    _shared_cap_height_units: int = 700
+    _shared_scale: float = 1.0
+
     def _ensure_font(self) -> None:
         if self._font is not None:
             return
 
+        cls = HandwritingSynthesizer
+        if cls._shared_font is None:
+            with cls._font_lock:
+                if cls._shared_font is None:
+                    cls._load_shared_font()
+
+        self._font = cls._shared_font
+        self._glyph_set = cls._shared_glyph_set
+        self._cmap = cls._shared_cmap
+        self._glyph_info = cls._shared_glyph_info
+        self._cap_height_units = cls._shared_cap_height_units
+        self._scale = cls._shared_scale
+
+    @classmethod
+    def _load_shared_font(cls) -> None:
         if not _FONT_PATH.exists():
             print("Downloading PatrickHand-Regular.ttf from Google Fonts…", flush=True)
             try:
@@ -332,39 +460,56 @@ class HandwritingSynthesizer:
             except Exception as e:
                 raise RuntimeError(f"Could not download Patrick Hand font: {e}") from e
 
-        self._font = TTFont(str(_FONT_PATH))
-        self._glyph_set = self._font.getGlyphSet()
-        self._cmap = self._font.getBestCmap() or {}
+        font = TTFont(str(_FONT_PATH))
+        glyph_set = font.getGlyphSet()
+        cmap = font.getBestCmap() or {}
 
-        upm = self._font["head"].unitsPerEm
-        os2 = self._font.get("OS/2")
+        upm = font["head"].unitsPerEm
+        os2 = font.get("OS/2")
         if os2 and getattr(os2, "sCapHeight", 0):
-            self._cap_height_units = os2.sCapHeight
+            cap_height_units = os2.sCapHeight
         else:
-            self._cap_height_units = int(upm * 0.7)
+            cap_height_units = int(upm * 0.7)
+
+        # Frozen codepoint → (glyph_name, advance) table, built once at load
+        # so rendering never touches cmap/glyph-set/hasattr again.
+        glyph_info: dict[int, tuple[str, float]] = {}
+        for cp, name in cmap.items():
+            glyph = glyph_set.get(name)
+            if glyph is None:
+                continue
+            glyph_info[cp] = (name, float(getattr(glyph, "width", cap_height_units * 0.5)))
 
-        self._scale = _TARGET_CAP_HEIGHT_PX / self._cap_height_units
+        cls._shared_glyph_set = glyph_set
+        cls._shared_cmap = cmap
+        cls._shared_glyph_info = glyph_info
+        cls._shared_cap_height_units = cap_height_units
+        cls._shared_scale = _TARGET_CAP_HEIGHT_PX / cap_height_units
+        cls._shared_font = font  # set last: publishes the load to other threads
+
+        cls._load_skeleton_cache()
 
     # ── Glyph skeleton (cached) ───────────────────────────────────────────────
 
-    def _get_glyph_skeleton(
-        self, glyph_name: str
-    ) -> list[list[tuple[float, float]]]:
+    def _get_glyph_skeleton(self, glyph_name: str) -> tuple[list[np.ndarray], float]:
         """
-        Return skeleton stroke paths for *glyph_name* in font-unit coordinates
-        (x right, y up, baseline at y=0).  Computed once and cached.
+        Return (skeleton stroke paths, advance width) for *glyph_name* in
+        font-unit coordinates (x right, y up, baseline at y=0).  Computed once
+        and cached for the whole process.
         """
-        if glyph_name in self._skeleton_cache:
-            return self._skeleton_cache[glyph_name]
+        cached = self._skeleton_cache.get(glyph_name)
+        if cached is not None:
+            return cached
 
         glyph = self._glyph_set[glyph_name]
+        advance = float(glyph.width if hasattr(glyph, "width") else self._cap_height_units * 0.5)
         pen = RecordingPen()
         glyph.draw(pen)
         contours = _recording_to_contours(pen.value)
 
         if not contours:
-            self._skeleton_cache[glyph_name] = []
-            return []
+            self._skeleton_cache[glyph_name] = ([], advance)
+            return [], advance
 
         # pixels-per-font-unit in the raster image
         rs = self._scale * _OVERSAMPLE
@@ -396,13 +541,13 @@ class HandwritingSynthesizer:
 
         arr = np.array(img) > 127
         if not arr.any():
-            self._skeleton_cache[glyph_name] = []
-            return []
+            self._skeleton_cache[glyph_name] = ([], advance)
+            return [], advance
 
         skel = _zhang_suen_thin(arr)
         pixel_paths = _trace_skeleton(skel)
 
-        font_paths: list[list[tuple[float, float]]] = []
+        font_paths: list[np.ndarray] = []
         for pp in pixel_paths:
             if len(pp) < 2:
                 continue
@@ -413,10 +558,12 @@ class HandwritingSynthesizer:
             ]
             fp = _smooth_path(fp, window=5)
             if len(fp) >= 2:
-                font_paths.append(fp)
+                path_arr = np.asarray(fp, dtype=np.float64)
+                path_arr.flags.writeable = False  # shared across cache hits
+                font_paths.append(path_arr)
 
-        self._skeleton_cache[glyph_name] = font_paths
-        return font_paths
+        self._skeleton_cache[glyph_name] = (font_paths, advance)
+        return font_paths, advance
 
     # ── Public API ────────────────────────────────────────────────────────────
 
@@ -429,7 +576,11 @@ class HandwritingSynthesizer:
         pos = position or {"x": 100, "y": 100}
         try:
             self._ensure_font()
-            return self._synthesize_with_font(text, color, pos)
+            result = self._synthesize_with_font(text, color, pos)
+            # Runs in a worker thread (orchestrator dispatches via executor),
+            # so flushing new glyphs to disk here never blocks the event loop.
+            self._persist_skeleton_cache()
+            return result
         except Exception as exc:
             print(f"Handwriting synthesis failed ({exc}); using stub.", flush=True)
             return self._stub(text, color, pos)
@@ -444,57 +595,64 @@ class HandwritingSynthesizer:
         superscript_rise = _TARGET_CAP_HEIGHT_PX * 0.55
         drawn_char_count = 0
 
+        # Hoisted out of draw_char: these are invariant across the whole call
+        # and attribute/dict lookups add up over hundreds of characters.
+        pos_x = position["x"]
+        pos_y = position["y"]
+        cap_units = self._cap_height_units
+        cp_cache = self._codepoint_cache
+        glyph_info = self._glyph_info
+        rng_uniform = self._rng.uniform
+
         def draw_char(char: str, char_scale: float, y_offset_px: float = 0.0) -> float:
             nonlocal drawn_char_count
 
             if char == " ":
-                return self._cap_height_units * 0.32 * char_scale
-
-            glyph_name = self._cmap.get(ord(char)) if self._cmap else None  # type: ignore[union-attr]
-            if glyph_name is None or glyph_name not in self._glyph_set:
-                return self._cap_height_units * 0.35 * char_scale
-
-            try:
-                glyph = self._glyph_set[glyph_name]
-                advance_units = glyph.width if hasattr(glyph, "width") else self._cap_height_units * 0.5
-                font_paths = self._get_glyph_skeleton(glyph_name)
-            except Exception as exc:
-                print(f"Glyph skeleton failed for {char!r}: {exc}", flush=True)
-                return self._cap_height_units * 0.35 * char_scale
+                return cap_units * 0.32 * char_scale
+
+            cp = ord(char)
+            entry = cp_cache.get(cp, _UNCACHED)
+            if entry is _UNCACHED:
+                info = glyph_info.get(cp)
+                if info is None:
+                    entry = None
+                else:
+                    try:
+                        entry = self._get_glyph_skeleton(info[0])
+                    except Exception as exc:
+                        # Transient failure — fall back without caching so the
+                        # glyph is retried on its next occurrence.
+                        print(f"Glyph skeleton failed for {char!r}: {exc}", flush=True)
+                        return cap_units * 0.35 * char_scale
+                cp_cache[cp] = entry
+
+            if entry is None:
+                return cap_units * 0.35 * char_scale
+            font_paths, advance_units = entry
 
             # Stroke width: slightly thicker than the raw 1-px skeleton to look like pen ink.
             # Scale proportionally for superscripts.
             scale_ratio = char_scale / max(scale, 1e-9)
             stroke_width = round(2.2 * scale_ratio**0.9, 2)
 
+            jitter = 0.4 * scale_ratio
             for fp in font_paths:
-                if len(fp) < 2:
-                    continue
-                points: list[StrokePoint] = []
                 n = len(fp)
+                if n < 2:
+                    continue
 
-                for idx, (fx, fy) in enumerate(fp):
-                    cx = position["x"] + x_cursor + fx * char_scale
-                    cy = position["y"] - fy * char_scale - y_offset_px
-
-                    # Sine pressure curve: softer at stroke start/end, full in middle
-                    t = idx / max(n - 1, 1)
-                    pressure = 0.35 + 0.65 * math.sin(math.pi * t)
-
-                    # Light pen-jitter proportional to scale
-                    jitter = 0.4 * scale_ratio
-                    cx += random.uniform(-jitter, jitter)
-                    cy += random.uniform(-jitter, jitter)
-
-                    points.append(
-                        StrokePoint(
-                            x=round(cx, 2),
-                            y=round(cy, 2),
-                            pressure=round(pressure, 3),
-                        )
-                    )
+                # Whole-contour transform + pen-jitter in a few array ops.
+                xy = np.empty((n, 2))
+                xy[:, 0] = pos_x + x_cursor + fp[:, 0] * char_scale
+                xy[:, 1] = pos_y - fp[:, 1] * char_scale - y_offset_px
+                xy += rng_uniform(-jitter, jitter, (n, 2))
 
-                strokes.append(Stroke(points=points, color=color, width=stroke_width))
+                # No rounding here: to_dict quantizes once at serialization,
+                # so the hot path skips a full np.round pass per contour.
+                pts = np.empty((n, 3), dtype=np.float32)
+                pts[:, :2] = xy
+                pts[:, 2] = _pressure_curve(n)
+                strokes.append(Stroke(points=pts, color=color, width=stroke_width))
 
             drawn_char_count += 1
             return advance_units * char_scale
@@ -522,31 +680,34 @@ class HandwritingSynthesizer:
                 return "".join(buf), (len(src) - start_idx)
             return src[start_idx], 1
 
+        # Split the text into plain runs separated by superscript tokens:
+        # str.find jumps straight to the next caret in C, so text without
+        # superscripts (the common case) skips the per-character dispatch
+        # the old single-cursor walk paid on every code point.
         i = 0
-        while i < len(text):
-            char = text[i]
-            if char == "\n":
-                i += 1
-                continue
-
-            if char == "^":
-                token, consumed = read_superscript_token(text, i + 1)
-                if consumed > 0 and token:
-                    for sup_char in token:
-                        if sup_char in "\n{}()":
-                            continue
-                        x_cursor += draw_char(
-                            sup_char,
-                            char_scale=superscript_scale,
-                            y_offset_px=superscript_rise,
-                        )
-                    i += consumed + 1
-                    continue
-                i += 1
-                continue
+        n = len(text)
+        while i < n:
+            caret = text.find("^", i)
+            run = text[i:] if caret == -1 else text[i:caret]
+            for char in run:
+                if char != "\n":
+                    x_cursor += draw_char(char, char_scale=scale)
+            if caret == -1:
+                break
 
-            x_cursor += draw_char(char, char_scale=scale)
-            i += 1
+            token, consumed = read_superscript_token(text, caret + 1)
+            if consumed > 0 and token:
+                for sup_char in token:
+                    if sup_char in "\n{}()":
+                        continue
+                    x_cursor += draw_char(
+                        sup_char,
+                        char_scale=superscript_scale,
+                        y_offset_px=superscript_rise,
+                    )
+                i = caret + consumed + 1
+            else:
+                i = caret + 1
 
         total_pts = sum(len(s.points) for s in strokes)
         target_sec = max(1.0, 0.12 * max(drawn_char_count, 1))
@@ -566,13 +727,33 @@ class HandwritingSynthesizer:
                 continue
             stub_strokes.append(
                 Stroke(
-                    points=[
-                        StrokePoint(x=position["x"] + x_off, y=position["y"]),
-                        StrokePoint(x=position["x"] + x_off + 8, y=position["y"] + 12),
-                    ],
+                    points=np.array(
+                        [
+                            [position["x"] + x_off, position["y"], 0.8],
+                            [position["x"] + x_off + 8, position["y"] + 12, 0.8],
+                        ],
+                        dtype=np.float32,
+                    ),
                     color=color,
                     width=2.0,
                 )
             )
             x_off += 12
         return StrokeData(strokes=stub_strokes, position=position, animation_speed=1.0)
+
+
+# ── Process-wide singleton ────────────────────────────────────────────────────
+
+_shared_synthesizer: HandwritingSynthesizer | None = None
+
+
+def get_synthesizer() -> HandwritingSynthesizer:
+    """
+    Shared synthesizer for the whole process.  The heavy state (parsed font,
+    glyph skeletons) already lives on the class, so this mainly saves the
+    per-session construction and keeps all sessions warming the same caches.
+    """
+    global _shared_synthesizer
+    if _shared_synthesizer is None:
+        _shared_synthesizer = HandwritingSynthesizer()
+    return _shared_synthesizer
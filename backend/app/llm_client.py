@@ -1,10 +1,148 @@
-import json
+import asyncio
+import hashlib
+import logging
 import os
 import re
-from collections.abc import Awaitable, Callable
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Optional
 
 import anthropic
+import orjson
+
+log = logging.getLogger(__name__)
+
+
+async def _buffered(source: AsyncIterator[str], size: int = 4) -> AsyncIterator[str]:
+    """
+    Let the network producer run up to *size* items ahead of the consumer.
+
+    A plain `async for` over the SDK stream only reads between iterations, so
+    the socket idles while Python runs the chunk scanners. A small queue fed
+    by a pump task overlaps the network read with that CPU work while keeping
+    memory bounded.
+    """
+    queue: asyncio.Queue[tuple[bool, object]] = asyncio.Queue(maxsize=size)
+
+    async def _pump() -> None:
+        try:
+            async for item in source:
+                await queue.put((False, item))
+        except Exception as exc:  # re-raised on the consumer side
+            await queue.put((True, exc))
+        else:
+            await queue.put((True, None))
+
+    pump = asyncio.create_task(_pump())
+    try:
+        while True:
+            is_end, payload = await queue.get()
+            if is_end:
+                if payload is not None:
+                    raise payload  # type: ignore[misc]
+                return
+            yield payload  # type: ignore[misc]
+    finally:
+        pump.cancel()
+
+# Strips a markdown code fence if the model wraps its JSON despite instructions.
+_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+
+_JSON_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+class _SpeechExtractor:
+    """
+    Incremental scanner for the "speech" string in a streamed JSON response.
+
+    feed(chunk) consumes each streamed chunk exactly once (O(N) total across
+    the stream) and returns the fully unescaped speech text as soon as its
+    closing quote arrives, or None while it is still incomplete. Unlike the
+    previous regex + slice approach, escape sequences — including \\uXXXX —
+    are decoded, so the text handed to TTS matches what json.loads would
+    produce for the finished response.
+    """
+
+    __slots__ = ("_state", "_tail", "_out", "_hex")
+
+    _KEY = '"speech"'
+
+    def __init__(self) -> None:
+        self._state = "seek_key"
+        self._tail = ""  # unmatched text retained while seeking the key
+        self._out: list[str] = []
+        self._hex = ""
+
+    def feed(self, chunk: str) -> str | None:
+        if self._state == "seek_key":
+            buf = self._tail + chunk
+            idx = buf.find(self._KEY)
+            if idx == -1:
+                # Keep enough tail for a key split across the chunk boundary.
+                self._tail = buf[-(len(self._KEY) - 1):]
+                return None
+            self._state = "seek_colon"
+            self._tail = ""
+            chunk = buf[idx + len(self._KEY):]
+
+        for pos, ch in enumerate(chunk):
+            state = self._state
+
+            if state == "in_string":
+                if ch == '"':
+                    self._state = "done"
+                    return "".join(self._out)
+                if ch == "\\":
+                    self._state = "escape"
+                else:
+                    self._out.append(ch)
+
+            elif state == "escape":
+                if ch == "u":
+                    self._state = "unicode"
+                    self._hex = ""
+                else:
+                    self._out.append(_JSON_ESCAPES.get(ch, ch))
+                    self._state = "in_string"
+
+            elif state == "unicode":
+                self._hex += ch
+                if len(self._hex) == 4:
+                    try:
+                        self._out.append(chr(int(self._hex, 16)))
+                    except ValueError:
+                        pass  # malformed escape — drop it rather than crash
+                    self._state = "in_string"
+
+            elif state == "seek_colon":
+                if ch == ":":
+                    self._state = "seek_value"
+                elif not ch.isspace():
+                    self._state = "seek_key"
+                    return self.feed(chunk[pos:])
+
+            elif state == "seek_value":
+                if ch == '"':
+                    self._state = "in_string"
+                elif not ch.isspace():
+                    # "speech" key with a non-string value; keep looking.
+                    self._state = "seek_key"
+                    return self.feed(chunk[pos:])
+
+            else:  # done
+                return None
+
+        return None
+
 
 SYSTEM_PROMPT = """
 You are Professor KIA — an excellent tutor having a live voice conversation with a student while sharing a digital whiteboard.
@@ -194,7 +332,24 @@ GENERAL RULES
 """
 
 
+# One SDK client — and therefore one HTTP connection pool — per process.
+# An LLMClient is constructed per session; without this each session paid a
+# fresh TLS handshake on its first turn instead of reusing warm connections.
+_anthropic_client: anthropic.AsyncAnthropic | None = None
+
+
+def _get_anthropic_client(api_key: str) -> anthropic.AsyncAnthropic:
+    global _anthropic_client
+    if _anthropic_client is None:
+        _anthropic_client = anthropic.AsyncAnthropic(api_key=api_key)
+    return _anthropic_client
+
+
 class LLMClient:
+    __slots__ = (
+        "client", "model", "_inflight", "_recent", "_last_snapshot", "_snap_hash"
+    )
+
     def __init__(self):
         api_key = (os.getenv("ANTHROPIC_API_KEY") or "").strip()
         if not api_key or api_key.upper().startswith("YOUR_") or api_key.upper() in {
@@ -207,10 +362,26 @@ class LLMClient:
                 "Set a real key in the project .env and restart the backend."
             )
 
-        self.client = anthropic.AsyncAnthropic(api_key=api_key)
+        self.client = _get_anthropic_client(api_key)
         # Default: Haiku (fast, cheap). Override with LLM_MODEL env var for Sonnet quality.
         self.model = os.getenv("LLM_MODEL", "claude-haiku-4-5-20251001")
 
+        # Duplicate-call guard: proactive review and snapshot events can fire
+        # the same (messages, snapshot) request twice within a second or two.
+        # In-flight futures let concurrent duplicates share one API call, and
+        # a short-TTL result cache absorbs immediate re-asks.
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._recent: dict[str, tuple[float, dict]] = {}
+        # (hash, image content block) of the last attached snapshot —
+        # board-review bursts resend the same PNG, so the block is reused.
+        self._last_snapshot: tuple[str, dict] | None = None
+        # (b64 str object, digest) — BoardSnapshot.as_base64 returns the same
+        # cached str across turns, so an identity check skips re-encoding and
+        # re-hashing ~100 KB of base64 per call on an unchanged board.
+        self._snap_hash: tuple[str, str] | None = None
+
+    _DEDUP_TTL_SEC = 5.0
+
     async def get_response(
         self,
         messages: list[dict],
@@ -223,91 +394,221 @@ class LLMClient:
         As soon as the "speech" field is complete in the JSON stream, calls
         on_speech_ready(text) so the caller can kick off TTS immediately —
         while the rest of the JSON (board_actions, etc.) continues streaming.
+        Board actions are only returned with the full parse: rebasing in the
+        orchestrator needs the complete set of writes to compute vertical
+        placement and scrolling, so per-action streaming would buy nothing.
 
         Returns the fully parsed response dict when the stream ends.
+
+        Identical concurrent calls share one API round-trip; a follower's
+        callbacks are replayed from the shared result.
         """
+        key = self._request_key(messages, board_snapshot_b64)
+        now = time.monotonic()
+
+        cached = self._recent.get(key)
+        if cached is not None and now - cached[0] < self._DEDUP_TTL_SEC:
+            await self._replay_callbacks(cached[1], on_speech_ready)
+            return cached[1]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            result = await inflight
+            await self._replay_callbacks(result, on_speech_ready)
+            return result
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._stream_response(
+                messages, board_snapshot_b64, on_speech_ready
+            )
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved for the no-follower case
+            raise
+        else:
+            future.set_result(result)
+            self._recent = {
+                k: v
+                for k, v in self._recent.items()
+                if time.monotonic() - v[0] < self._DEDUP_TTL_SEC
+            }
+            self._recent[key] = (time.monotonic(), result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def _snapshot_hash(self, snapshot_b64: str) -> str:
+        """Digest of the snapshot base64, memoized by string identity."""
+        memo = self._snap_hash
+        if memo is not None and memo[0] is snapshot_b64:
+            return memo[1]
+        digest = hashlib.blake2b(snapshot_b64.encode(), digest_size=16).hexdigest()
+        self._snap_hash = (snapshot_b64, digest)
+        return digest
+
+    def _request_key(self, messages: list[dict], snapshot_b64: Optional[str]) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(self.model.encode())
+        h.update(orjson.dumps(messages))
+        if snapshot_b64:
+            h.update(self._snapshot_hash(snapshot_b64).encode())
+        return h.hexdigest()
+
+    @staticmethod
+    async def _replay_callbacks(
+        result: dict,
+        on_speech_ready: Optional[Callable[[str], Awaitable[None]]],
+    ) -> None:
+        if on_speech_ready and result.get("speech"):
+            await on_speech_ready(result["speech"])
+
+    async def _stream_response(
+        self,
+        messages: list[dict],
+        board_snapshot_b64: Optional[str],
+        on_speech_ready: Optional[Callable[[str], Awaitable[None]]],
+    ) -> dict:
         prepared = self._attach_snapshot(messages, board_snapshot_b64)
 
-        accumulated = ""
+        # Chunks are collected in a list and joined once at stream end; the
+        # scanners below are chunk-incremental, so nothing needs a contiguous
+        # view mid-stream and the quadratic str += chain is avoided.
+        parts: list[str] = []
         speech_fired = False
+        speech_task: asyncio.Task | None = None
+        extractor = _SpeechExtractor()
+
+        # Brace-depth tracker for early exit: once the top-level object
+        # closes, anything else the model emits is trailing noise and the
+        # loop can stop instead of draining it token by token. Only armed
+        # when the stream opens with '{' — if the model wrapped its JSON in
+        # a markdown fence (or any preamble), exiting at the matching '}'
+        # would clip the closing ``` and defeat _parse_response's fence
+        # recovery, so the full stream is drained instead.
+        depth = 0
+        in_str = False
+        esc = False
+        json_done = False
+        bare_json: bool | None = None  # None until first non-whitespace char
 
         async with self.client.messages.stream(
             model=self.model,
             max_tokens=1024,
-            system=SYSTEM_PROMPT,
+            # cache_control lets the API reuse the processed system prompt
+            # across turns — cheaper tokens and lower first-token latency,
+            # which directly gates TTS start.
+            system=[
+                {
+                    "type": "text",
+                    "text": SYSTEM_PROMPT,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
             messages=prepared,
         ) as stream:
-            async for chunk in stream.text_stream:
-                accumulated += chunk
+            async for chunk in _buffered(stream.text_stream):
+                parts.append(chunk)
 
                 # Fire on_speech_ready the moment the speech field is complete
                 if not speech_fired and on_speech_ready:
-                    speech = self._try_extract_speech(accumulated)
+                    speech = extractor.feed(chunk)
                     if speech is not None:
                         speech_fired = True
-                        await on_speech_ready(speech)
-
-        return self._parse_response(accumulated)
+                        # Kick TTS off without stalling stream consumption;
+                        # awaited below so errors still propagate.
+                        speech_task = asyncio.create_task(on_speech_ready(speech))
+
+                if bare_json is False:
+                    continue
+                for ch in chunk:
+                    if bare_json is None:
+                        if ch.isspace():
+                            continue
+                        bare_json = ch == "{"
+                        if not bare_json:
+                            break
+                    if esc:
+                        esc = False
+                    elif in_str:
+                        if ch == "\\":
+                            esc = True
+                        elif ch == '"':
+                            in_str = False
+                    elif ch == '"':
+                        in_str = True
+                    elif ch == "{":
+                        depth += 1
+                    elif ch == "}":
+                        depth -= 1
+                        if depth == 0:
+                            json_done = True
+                            break
+                if json_done:
+                    break
+
+        if speech_task is not None:
+            await speech_task
+
+        return self._parse_response("".join(parts))
 
     # ── Private helpers ──────────────────────────────────────────────────────
 
-    def _try_extract_speech(self, partial: str) -> str | None:
-        """
-        Attempt to extract the speech field value from a partial JSON string.
-        Returns None if the speech field is not yet complete in the stream.
-        """
-        match = re.search(r'"speech"\s*:\s*"', partial)
-        if not match:
-            return None
-
-        start = match.end()
-        i = start
-        while i < len(partial):
-            if partial[i] == "\\" and i + 1 < len(partial):
-                i += 2  # skip escape sequence
-                continue
-            if partial[i] == '"':
-                return partial[start:i]
-            i += 1
-
-        return None  # speech field not yet closed
-
     def _attach_snapshot(
         self, messages: list[dict], snapshot_b64: Optional[str]
     ) -> list[dict]:
         if not snapshot_b64 or not messages:
             return messages
 
-        result = list(messages)
-        for i in reversed(range(len(result))):
-            if result[i]["role"] == "user":
-                original_text = result[i]["content"]
-                result[i] = {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "image/png",
-                                "data": snapshot_b64,
-                            },
-                        },
-                        {"type": "text", "text": original_text},
-                    ],
-                }
-                break
+        idx = next(
+            (i for i in range(len(messages) - 1, -1, -1) if messages[i]["role"] == "user"),
+            None,
+        )
+        if idx is None:
+            return messages
 
-        return result
+        # Reuse the image block across turns with an unchanged board. The
+        # block itself must still be sent — prior multimodal messages are not
+        # kept in conversation_history, so omitting it would blind the model.
+        snap_hash = self._snapshot_hash(snapshot_b64)
+        if self._last_snapshot is not None and self._last_snapshot[0] == snap_hash:
+            image_block = self._last_snapshot[1]
+        else:
+            image_block = {
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": "image/png",
+                    "data": snapshot_b64,
+                },
+            }
+            self._last_snapshot = (snap_hash, image_block)
+
+        new_msg = {
+            "role": "user",
+            "content": [
+                image_block,
+                {"type": "text", "text": messages[idx]["content"]},
+            ],
+        }
+        # Only the replaced message is new; the rest of the transcript is
+        # shared by reference with the caller's list.
+        return messages[:idx] + [new_msg] + messages[idx + 1:]
 
     def _parse_response(self, raw: str) -> dict:
-        fence_match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", raw)
-        json_str = fence_match.group(1) if fence_match else raw.strip()
+        # The prompt forbids fences, so nearly every response skips the regex
+        # via this O(n) substring guard.
+        if "```" in raw:
+            fence_match = _FENCE_RE.search(raw)
+            json_str = fence_match.group(1) if fence_match else raw.strip()
+        else:
+            json_str = raw.strip()
 
         try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError:
-            print(f"[LLM] JSON parse failed. Raw output:\n{raw[:500]}")
+            data = orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            log.warning("JSON parse failed. Raw output:\n%.500s", raw)
             return {
                 "speech": raw.strip(),
                 "board_actions": [],
@@ -316,7 +617,8 @@ class LLMClient:
             }
 
         board_actions = data.get("board_actions", [])
-        print(f"[LLM] board_actions ({len(board_actions)}): {json.dumps(board_actions)[:300]}")
+        # %.300s formats lazily — the repr is only built if debug is enabled.
+        log.debug("board_actions (%d): %.300s", len(board_actions), board_actions)
 
         return {
             "speech": data.get("speech", ""),
@@ -1,28 +1,34 @@
+import logging
 import os
 import uuid
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.orchestrator import Orchestrator
-from app.session import TutorSession
-
+# Load .env BEFORE importing app modules — the orchestrator reads its tuning
+# env vars at import time, so they must already be in the environment.
 # Use __file__ so this always resolves correctly regardless of CWD.
 # main.py is at backend/app/main.py, so two parents up is the project root.
 _env_path = Path(__file__).resolve().parent.parent.parent / ".env"
 load_dotenv(_env_path, override=True)
 
+from app.orchestrator import Orchestrator
+from app.session import TutorSession
+
+log = logging.getLogger(__name__)
+
 sessions: dict[str, TutorSession] = {}
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print("AI Tutor backend starting up...")
+    log.info("AI Tutor backend starting up...")
     yield
-    print("AI Tutor backend shutting down...")
+    log.info("AI Tutor backend shutting down...")
 
 
 app = FastAPI(title="AI Tutor API", version="0.1.0", lifespan=lifespan)
@@ -45,26 +51,39 @@ async def health_check():
 async def websocket_endpoint(websocket: WebSocket, session_id: str):
     await websocket.accept()
 
-    if session_id not in sessions:
-        sessions[session_id] = TutorSession(session_id=session_id)
+    session = sessions.get(session_id)
+    if session is None:
+        session = sessions[session_id] = TutorSession(session_id=session_id)
 
-    session = sessions[session_id]
     orchestrator = Orchestrator(session=session, websocket=websocket)
 
     try:
         await orchestrator.on_connect()
         while True:
-            data = await websocket.receive_json()
-            await orchestrator.handle_message(data)
+            # receive() + orjson instead of receive_json(): every mic chunk
+            # and board event goes through here, and stdlib json is the
+            # slowest part of that path. Accepts text or binary frames.
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            raw = message.get("bytes")
+            if raw is not None and not raw.startswith((b"{", b"[")):
+                # Opcode-prefixed binary frame (mic audio) — no JSON involved.
+                await orchestrator.handle_binary(raw)
+                continue
+            if raw is None:
+                raw = message.get("text") or b""
+            await orchestrator.handle_message(orjson.loads(raw))
     except WebSocketDisconnect:
-        print(f"Session {session_id} disconnected")
-        orchestrator.cleanup()
-        sessions.pop(session_id, None)
+        log.info("Session %s disconnected", session_id)
     except Exception as e:
-        print(f"Error in session {session_id}: {e}")
-        orchestrator.cleanup()
+        log.exception("Error in session %s", session_id)
         # WebSocket close reason has a 123-byte hard limit — truncate to be safe
         await websocket.close(code=1011, reason=str(e)[:100])
+    finally:
+        # Runs on every exit path (including cancellation at shutdown), so a
+        # crashed handler can no longer leak its entry and grow the dict.
+        orchestrator.cleanup()
         sessions.pop(session_id, None)
 
 
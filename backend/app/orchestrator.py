@@ -1,18 +1,83 @@
 import asyncio
-import base64
 import os
+import re
 import time
 import textwrap
+from binascii import a2b_base64
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+import numpy as np
+import orjson
 from fastapi import WebSocket
 
 from app.handwriting.latex_to_strokes import LaTeXToStrokes
-from app.handwriting.synthesizer import HandwritingSynthesizer
+from app.handwriting.synthesizer import Stroke, StrokeData, get_synthesizer
 from app.llm_client import LLMClient
 from app.session import TutorSession
-from app.stt_client import STTClient
+from app.stt_client import AudioChunkQueue, STTClient
 from app.tts_client import TTSClient
 
+# How many queued messages the socket writer folds into one batch frame, and
+# how long it waits for stragglers after the first message arrives. Stroke
+# dispatch queues a burst of messages back-to-back; one frame carries them all.
+_SEND_BATCH_MAX = 16
+_SEND_BATCH_WINDOW_SEC = 0.005
+
+# Opcode prefix for binary WebSocket frames carrying raw audio bytes, in both
+# directions: TTS PCM going out and mic webm/opus chunks coming in. Skipping
+# base64+JSON saves ~33% wire bytes and two encode passes per audio frame.
+_AUDIO_FRAME_PREFIX = b"\x01"
+
+# Cap on buffered mic chunks awaiting Deepgram. If the STT upstream stalls,
+# the oldest chunks are dropped rather than growing the queue without bound —
+# recent audio is what matters for transcription.
+_AUDIO_QUEUE_MAX = 200
+
+# Tuning knobs, parsed once at import (main.py loads .env first). Reading
+# os.environ plus a float() parse per WebSocket connect adds avoidable work
+# to on_connect under reconnect storms.
+_ECHO_COOLDOWN_SEC = float(os.getenv("ECHO_COOLDOWN_SEC", "1.2"))
+_AUTO_BARGE_DEBOUNCE_SEC = float(os.getenv("AUTO_BARGE_DEBOUNCE_SEC", "0.5"))
+_BARGE_START_GUARD_SEC = float(os.getenv("BARGE_START_GUARD_SEC", "0.25"))
+_AUTO_BARGE_CONFIRM_WINDOW_SEC = float(os.getenv("AUTO_BARGE_CONFIRM_WINDOW_SEC", "1.5"))
+_STT_MERGE_WINDOW_SEC = float(os.getenv("STT_MERGE_WINDOW_SEC", "0.8"))
+_BOARD_WRITE_X = float(os.getenv("BOARD_WRITE_X", "20"))
+
+# Sentence-chunked TTS: long speech is split at sentence boundaries and the
+# sentences are synthesized concurrently (bounded), while playback stays in
+# order — time-to-first-audio depends on the first sentence only, and the
+# network latency of later sentences overlaps the audio already playing.
+# Short speech goes out as one request; tiny per-sentence requests would just
+# add connection overhead and chop the prosody.
+_TTS_SENTENCE_RE = re.compile(r"[^.?!]+[.?!]+[\"')\]]*\s*|[^.?!]+$")
+_TTS_SPLIT_MIN_CHARS = 120    # below this, one request is strictly better
+_TTS_MIN_CHUNK_CHARS = 60     # merge adjacent short sentences up to this
+_TTS_MAX_CONCURRENCY = 3
+
+# Handwriting synth cache: short tokens repeat constantly on a math board
+# (numerals, operators, variable names, "Step 1"). Results are synthesized in
+# an origin frame and keyed by (text, color); a hit is one vectorized
+# translation instead of a glyph-walk on the thread pool. Long lines rarely
+# repeat, so they bypass the cache to keep it small and hit-dense.
+_HW_CACHE_MAX = 256
+_HW_CACHE_MAX_CHARS = 32
+
+
+@lru_cache(maxsize=16)
+def _wrapper(chars_per_line: int) -> textwrap.TextWrapper:
+    """
+    Shared TextWrapper per line width. textwrap.wrap() builds a new wrapper
+    (with its regexes) on every call; the width only changes when the board
+    is resized, so one cached instance serves every line of every write.
+    """
+    return textwrap.TextWrapper(
+        width=chars_per_line,
+        break_long_words=False,
+        break_on_hyphens=False,
+    )
+
 
 class Orchestrator:
     """Routes incoming WebSocket messages to the appropriate subsystem."""
@@ -20,41 +85,58 @@ class Orchestrator:
     def __init__(self, session: TutorSession, websocket: WebSocket):
         self.session = session
         self.websocket = websocket
+        # Constructed inside the websocket handler, so the loop is running;
+        # cache it once instead of calling get_running_loop per write action.
+        self._loop = asyncio.get_running_loop()
         self.llm = LLMClient()
         self.tts = TTSClient()
         self.stt = STTClient()
-        self.handwriting = HandwritingSynthesizer()
+        self.handwriting = get_synthesizer()
         self.latex = LaTeXToStrokes()
+        # Dedicated bounded pool for handwriting synthesis — keeps CPU-bound
+        # fontTools work off both the event loop and the default executor
+        # (which audio/network helpers share), with a predictable cap.
+        self._hw_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hw")
+        # LRU of origin-frame synth results for short repeated tokens.
+        self._hw_cache: OrderedDict[tuple[str, str], tuple[StrokeData, int]] = (
+            OrderedDict()
+        )
 
         # STT state — set up when audio_start is received
-        self._audio_queue: asyncio.Queue | None = None
+        self._audio_queue: AudioChunkQueue | None = None
         self._stt_task: asyncio.Task | None = None
+        self._audio_dropped: int = 0
+        self._stt_encoding: str = "webm-opus"
+        self._stt_sample_rate: int = 16000
 
         # Echo cooldown: ignore transcripts for this many seconds after Ada's
         # audio is sent, to prevent Ada's own TTS voice from being re-processed.
         self._last_tts_sent_at: float = 0.0
         self._last_tts_started_at: float = 0.0
-        self._echo_cooldown: float = float(os.getenv("ECHO_COOLDOWN_SEC", "1.2"))
-        self._auto_barge_debounce_sec: float = float(
-            os.getenv("AUTO_BARGE_DEBOUNCE_SEC", "0.5")
-        )
-        self._barge_start_guard_sec: float = float(
-            os.getenv("BARGE_START_GUARD_SEC", "0.25")
-        )
-        self._auto_barge_confirm_window_sec: float = float(
-            os.getenv("AUTO_BARGE_CONFIRM_WINDOW_SEC", "1.5")
-        )
+        self._echo_cooldown: float = _ECHO_COOLDOWN_SEC
+        self._auto_barge_debounce_sec: float = _AUTO_BARGE_DEBOUNCE_SEC
+        self._barge_start_guard_sec: float = _BARGE_START_GUARD_SEC
+        self._auto_barge_confirm_window_sec: float = _AUTO_BARGE_CONFIRM_WINDOW_SEC
         self._last_auto_barge_at: float = 0.0
         self._pending_auto_barge_at: float | None = None
         self._tts_active: bool = False
-
-        # Barge-in control:
-        # _llm_lock serialises LLM calls so a new transcript from the STT task
-        # never starts a second LLM response while the first is still dispatching.
+        # Handle to the TTS streaming task for the response currently being
+        # dispatched — barge-in cancels it so synthesis stops immediately
+        # instead of streaming audio nobody will hear.
+        self._tts_task: asyncio.Task | None = None
+
+        # Turn control:
+        # All LLM turns (greeting, transcripts, proactive board analysis) go
+        # through a single-slot FIFO queue drained by one long-lived worker, so
+        # a second response can never start while the first is dispatching.
+        # If a new turn arrives while one is already pending, the stale pending
+        # turn is replaced — its user text is already in the history, so the
+        # newer turn's LLM call covers both without a wasted request.
         # _interrupted is set the instant speech is detected; _dispatch_llm_response
         # checks it before sending audio and before each stroke batch so the
         # remainder of Ada's current response is silently dropped.
-        self._llm_lock = asyncio.Lock()
+        self._turn_queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._turn_busy: bool = False
         self._interrupted: bool = False
 
         # Proactive board review:
@@ -71,12 +153,25 @@ class Orchestrator:
         # Deepgram can emit multiple final chunks for one human sentence.
         # Buffer and merge adjacent chunks briefly so Ada responds to the
         # complete thought instead of cutting off mid-question.
-        self._stt_merge_window_sec: float = float(os.getenv("STT_MERGE_WINDOW_SEC", "0.8"))
-        self._stt_buffer: list[str] = []
-        self._stt_flush_task: asyncio.Task | None = None
+        self._stt_merge_window_sec: float = _STT_MERGE_WINDOW_SEC
+        self._stt_buffer: deque[str] = deque()
+        # Debounce state: each buffered chunk pushes _stt_deadline forward and
+        # wakes the persistent debounce loop — no task cancel/recreate churn.
+        self._stt_deadline: float = 0.0
+        self._stt_wakeup = asyncio.Event()
 
         # Horizontal anchor for AI writing (world/page coordinates).
-        self._write_start_x: float = float(os.getenv("BOARD_WRITE_X", "20"))
+        self._write_start_x: float = _BOARD_WRITE_X
+
+        # Outbound send queue: every server→client message goes through one
+        # writer task that coalesces bursts (audio chunks, stroke batches)
+        # into a single {"type": "batch", "items": [...]} frame, so a response
+        # with many strokes costs a handful of WebSocket frames instead of one
+        # per message. The frontend unwraps batch frames transparently.
+        self._send_queue: asyncio.Queue = asyncio.Queue()
+        self._writer_task: asyncio.Task = asyncio.create_task(self._writer_loop())
+        self._turn_worker_task: asyncio.Task = asyncio.create_task(self._turn_worker())
+        self._stt_debounce_task: asyncio.Task = asyncio.create_task(self._stt_debounce_loop())
 
     def cleanup(self) -> None:
         """
@@ -86,8 +181,20 @@ class Orchestrator:
         """
         if self._stt_task and not self._stt_task.done():
             self._stt_task.cancel()
-        if self._stt_flush_task and not self._stt_flush_task.done():
-            self._stt_flush_task.cancel()
+        if not self._stt_debounce_task.done():
+            self._stt_debounce_task.cancel()
+        if not self._writer_task.done():
+            self._writer_task.cancel()
+        if not self._turn_worker_task.done():
+            self._turn_worker_task.cancel()
+        self._hw_pool.shutdown(wait=False, cancel_futures=True)
+        # Close the pooled MathJax, Deepgram, and ElevenLabs HTTP sessions
+        # (fire-and-forget; the loop is still running when main.py calls
+        # cleanup on disconnect).
+        if self._loop.is_running():
+            self._loop.create_task(self.latex.close())
+            self._loop.create_task(self.stt.close())
+            self._loop.create_task(self.tts.close())
         # Drain the audio queue with a sentinel so _send_audio exits cleanly
         if self._audio_queue is not None:
             try:
@@ -96,8 +203,57 @@ class Orchestrator:
                 pass
             self._audio_queue = None
 
+    def _send(self, payload: dict | bytes) -> None:
+        """
+        Queue a message for the socket writer. Never blocks the caller.
+        dicts become JSON text frames; bytes (opcode-prefixed audio) become
+        binary frames.
+        """
+        self._send_queue.put_nowait(payload)
+
+    async def _writer_loop(self) -> None:
+        """
+        Single outbound writer. Waits for the first queued message, lets a
+        short window pass so a burst lands together, then ships everything —
+        consecutive JSON messages coalesce into one frame (a bare message when
+        alone, a batch envelope otherwise); binary audio goes out as-is.
+        """
+        q = self._send_queue
+        try:
+            while True:
+                items = [await q.get()]
+                if q.empty():
+                    await asyncio.sleep(_SEND_BATCH_WINDOW_SEC)
+                while not q.empty() and len(items) < _SEND_BATCH_MAX:
+                    items.append(q.get_nowait())
+                run: list[dict] = []
+                for item in items:
+                    if isinstance(item, (bytes, bytearray, memoryview)):
+                        if run:
+                            await self._ship_json(run)
+                            run = []
+                        await self.websocket.send_bytes(item)
+                    else:
+                        run.append(item)
+                if run:
+                    await self._ship_json(run)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # Socket closed mid-send — main.py is about to call cleanup().
+            print(f"[Orchestrator] send writer stopped: {exc}")
+
+    async def _ship_json(self, run: list[dict]) -> None:
+        # orjson instead of send_json's stdlib dumps: stroke payloads are
+        # large nested dicts — serialization is the dominant per-send cost.
+        if len(run) == 1:
+            frame = orjson.dumps(run[0])
+        else:
+            frame = orjson.dumps({"type": "batch", "items": run})
+        await self.websocket.send_text(frame.decode())
+
     async def on_connect(self) -> None:
-        await self.websocket.send_json(
+        self._send(
             {
                 "type": "connected",
                 "session_id": self.session.session_id,
@@ -115,7 +271,7 @@ class Orchestrator:
         elif msg_type == "board_snapshot":
             await self._handle_board_snapshot(data)
         elif msg_type == "audio_start":
-            await self._handle_audio_start()
+            await self._handle_audio_start(data)
         elif msg_type == "audio_data":
             await self._handle_audio_data(data)
         elif msg_type == "audio_stop":
@@ -123,7 +279,7 @@ class Orchestrator:
         elif msg_type == "barge_in":
             await self._on_speech_start(source="manual")
         else:
-            await self.websocket.send_json(
+            self._send(
                 {"type": "error", "message": f"Unknown message type: {msg_type}"}
             )
 
@@ -140,63 +296,86 @@ class Orchestrator:
             "[Session started. Greet me naturally and ask what I need help with today.]",
             time.time(),
         )
-
-        async with self._llm_lock:
-            self._interrupted = False  # clear any stale barge-in from a previous response
-
-            tts_task: asyncio.Task | None = None
-            tts_started = asyncio.Event()
-
-            async def on_speech_ready(text: str) -> None:
-                nonlocal tts_task
-                self.session.add_assistant_turn(text, time.time())
-                await self.websocket.send_json({"type": "speech_text", "text": text})
-                tts_task = asyncio.create_task(self._stream_tts_chunks(text, tts_started))
-
-            llm_response = await self.llm.get_response(
-                self._messages_with_board_context(),
-                on_speech_ready=on_speech_ready,
-            )
-            await self._dispatch_llm_response(llm_response, tts_task, tts_started)
+        self._enqueue_turn({"kind": "greeting"})
 
     async def _handle_transcript(self, data: dict) -> None:
         text = data.get("text", "").strip()
         if not text:
             return
 
-        # Add to history immediately (outside the lock) so the turn is in
-        # context even if another handler acquires the lock first.
+        # Add to history immediately so the turn is in context even if this
+        # request is later replaced by a newer one in the queue.
         self.session.add_user_turn(text, time.time())
         self._last_interaction_at = time.time()
         self._wait_for_student = False  # student spoke — stop watching the board
 
         latest_snapshot = (
-            self.session.board_snapshots[-1].image_base64
+            self.session.board_snapshots[-1].as_base64()
             if self.session.board_snapshots
             else None
         )
+        self._enqueue_turn({"kind": "transcript", "snapshot": latest_snapshot})
 
-        # Acquire the lock so only one LLM call runs at a time.
-        # If a previous response is still dispatching (e.g. sending strokes),
-        # we wait here — _interrupted causes it to exit early quickly.
-        async with self._llm_lock:
-            self._interrupted = False  # this turn owns the response now
+    # ── Turn queue ───────────────────────────────────────────────────────────
 
-            tts_task: asyncio.Task | None = None
-            tts_started = asyncio.Event()
-
-            async def on_speech_ready(text: str) -> None:
-                nonlocal tts_task
-                self.session.add_assistant_turn(text, time.time())
-                await self.websocket.send_json({"type": "speech_text", "text": text})
-                tts_task = asyncio.create_task(self._stream_tts_chunks(text, tts_started))
+    def _enqueue_turn(self, req: dict) -> None:
+        """
+        Queue an LLM turn for the worker. The queue holds at most one pending
+        turn: if one is already waiting, it is replaced — every transcript is
+        already in the conversation history, so the newer turn's LLM call
+        responds to everything said and the stale call is never made.
+        """
+        q = self._turn_queue
+        while True:
+            try:
+                q.put_nowait(req)
+                return
+            except asyncio.QueueFull:
+                try:
+                    stale = q.get_nowait()
+                    print(f"[Orchestrator] Replacing stale pending turn: {stale.get('kind')}")
+                except asyncio.QueueEmpty:
+                    continue
 
-            llm_response = await self.llm.get_response(
-                self._messages_with_board_context(),
-                board_snapshot_b64=latest_snapshot,
-                on_speech_ready=on_speech_ready,
+    async def _turn_worker(self) -> None:
+        """Long-lived consumer: runs queued LLM turns strictly one at a time."""
+        while True:
+            req = await self._turn_queue.get()
+            self._turn_busy = True
+            try:
+                await self._run_turn(req)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                print(f"[Orchestrator] Turn failed: {exc}")
+            finally:
+                self._turn_busy = False
+
+    async def _run_turn(self, req: dict) -> None:
+        if req.get("kind") == "analysis":
+            await self._proactive_board_analysis(
+                req["image_b64"], trigger_time=req["trigger_time"]
             )
-            await self._dispatch_llm_response(llm_response, tts_task, tts_started)
+            return
+
+        self._interrupted = False  # this turn owns the response now
+
+        tts_task: asyncio.Task | None = None
+        tts_started = asyncio.Event()
+
+        async def on_speech_ready(text: str) -> None:
+            nonlocal tts_task
+            self.session.add_assistant_turn(text, time.time())
+            self._send({"type": "speech_text", "text": text})
+            tts_task = asyncio.create_task(self._stream_tts_chunks(text, tts_started))
+            self._tts_task = tts_task
+
+        llm_response = await self.llm.get_response(
+            self._messages_with_board_context(),
+            board_snapshot_b64=req.get("snapshot"),
+            on_speech_ready=on_speech_ready,
+        )
+        await self._dispatch_llm_response(llm_response, tts_task, tts_started)
 
     async def _handle_board_snapshot(self, data: dict) -> None:
         image_b64 = data.get("image_base64", "")
@@ -216,8 +395,10 @@ class Orchestrator:
                 self.session.student_content_bottom_y, int(student_max_y)
             )
 
-        self.session.add_board_snapshot(image_b64, time.time())
-        await self.websocket.send_json(
+        # Decode once on ingress; snapshots are retained as raw bytes and only
+        # re-encoded for the single image that actually reaches the LLM.
+        self.session.add_board_snapshot(a2b_base64(image_b64), time.time())
+        self._send(
             {"type": "snapshot_received", "count": len(self.session.board_snapshots)}
         )
 
@@ -232,18 +413,19 @@ class Orchestrator:
             self._wait_for_student       # Ada asked the student to work on the board
             and silent_for > 6.0         # student has been drawing, not just pausing to think
             and since_last_check > 15.0  # rate-limit: at most once per 15 s
-            and not self._llm_lock.locked()  # Ada isn't already responding
+            and not self._turn_busy      # Ada isn't already responding
+            and self._turn_queue.empty() # …and no turn is waiting to run
         ):
-            self._last_analysis_at = now  # claim the slot before task starts
-            asyncio.create_task(
-                self._proactive_board_analysis(image_b64, trigger_time=now)
+            self._last_analysis_at = now  # claim the slot before the turn runs
+            self._enqueue_turn(
+                {"kind": "analysis", "image_b64": image_b64, "trigger_time": now}
             )
 
     async def _proactive_board_analysis(
         self, image_b64: str, trigger_time: float
     ) -> None:
         """
-        Runs as a background task when the student has been drawing silently.
+        Runs on the turn worker when the student has been drawing silently.
         Sends the board snapshot to the LLM with a focused check-for-mistakes
         prompt; Ada responds with corrections in red using the same handwriting
         strokes (color="#FF0000") or encouragement if everything is correct.
@@ -253,62 +435,68 @@ class Orchestrator:
         give Ada natural context for future turns.  It is removed silently if
         the LLM finds nothing to say (empty board / only Ada's own notes).
         """
-        async with self._llm_lock:
-            # If the student spoke after this analysis was scheduled, skip it —
-            # their new message will already prompt a fresh response from Ada.
-            if self._last_interaction_at > trigger_time:
-                return
+        # If the student spoke after this analysis was scheduled, skip it —
+        # their new message will already prompt a fresh response from Ada.
+        if self._last_interaction_at > trigger_time:
+            return
 
-            self._interrupted = False
+        self._interrupted = False
 
-            # Synthetic user turn — represents the student pausing to let Ada check.
-            # Added inside the lock so it's never orphaned without an assistant reply.
-            self.session.add_user_turn("[checking my work on the board]", time.time())
+        # Synthetic user turn — represents the student pausing to let Ada check.
+        # Added on the worker so it's never orphaned without an assistant reply.
+        self.session.add_user_turn("[checking my work on the board]", time.time())
 
-            tts_task: asyncio.Task | None = None
-            tts_started = asyncio.Event()
+        tts_task: asyncio.Task | None = None
+        tts_started = asyncio.Event()
 
-            async def on_speech_ready(text: str) -> None:
-                nonlocal tts_task
-                if not text.strip():
-                    return
-                self.session.add_assistant_turn(text, time.time())
-                await self.websocket.send_json({"type": "speech_text", "text": text})
-                tts_task = asyncio.create_task(self._stream_tts_chunks(text, tts_started))
-
-            # Use the latest snapshot in case new drawing happened while waiting
-            current_image = (
-                self.session.board_snapshots[-1].image_base64
-                if self.session.board_snapshots
-                else image_b64
-            )
+        async def on_speech_ready(text: str) -> None:
+            nonlocal tts_task
+            if not text.strip():
+                return
+            self.session.add_assistant_turn(text, time.time())
+            self._send({"type": "speech_text", "text": text})
+            tts_task = asyncio.create_task(self._stream_tts_chunks(text, tts_started))
+            self._tts_task = tts_task
+
+        # Use the latest snapshot in case new drawing happened while waiting
+        current_image = (
+            self.session.board_snapshots[-1].as_base64()
+            if self.session.board_snapshots
+            else image_b64
+        )
 
-            llm_response = await self.llm.get_response(
-                self._messages_with_board_context(),
-                board_snapshot_b64=current_image,
-                on_speech_ready=on_speech_ready,
-            )
+        llm_response = await self.llm.get_response(
+            self._messages_with_board_context(),
+            board_snapshot_b64=current_image,
+            on_speech_ready=on_speech_ready,
+        )
 
-            speech = llm_response.get("speech", "").strip()
-            board_actions = llm_response.get("board_actions", [])
+        speech = llm_response.get("speech", "").strip()
+        board_actions = llm_response.get("board_actions", [])
 
-            if not speech and not board_actions:
-                # Nothing to say — remove the synthetic turn to keep history clean
-                history = self.session.conversation_history
-                if history and history[-1].content == "[checking my work on the board]":
-                    history.pop()
-                return
+        if not speech and not board_actions:
+            # Nothing to say — remove the synthetic turn to keep history clean
+            history = self.session.conversation_history
+            if history and history[-1].content == "[checking my work on the board]":
+                history.pop()
+            return
 
-            await self._dispatch_llm_response(llm_response, tts_task, tts_started)
+        await self._dispatch_llm_response(llm_response, tts_task, tts_started)
 
     # ── STT / Audio ──────────────────────────────────────────────────────────
 
-    async def _handle_audio_start(self) -> None:
+    async def _handle_audio_start(self, data: dict) -> None:
         """Open a Deepgram session as a background task."""
         if self._stt_task and not self._stt_task.done():
             self._stt_task.cancel()
 
-        self._audio_queue = asyncio.Queue()
+        # Capture format declared by the client: raw PCM16 from the
+        # AudioWorklet path, or webm/opus from the MediaRecorder fallback.
+        self._stt_encoding = data.get("encoding") or "webm-opus"
+        rate = data.get("sample_rate")
+        self._stt_sample_rate = int(rate) if isinstance(rate, (int, float)) else 16000
+
+        self._audio_queue = AudioChunkQueue(maxsize=_AUDIO_QUEUE_MAX)
         self._stt_task = asyncio.create_task(self._run_stt_session())
 
     async def _run_stt_session(self) -> None:
@@ -322,6 +510,9 @@ class Orchestrator:
                 self._audio_queue,
                 self._on_stt_transcript,
                 self._on_speech_start,
+                encoding=self._stt_encoding,
+                sample_rate=self._stt_sample_rate,
+                suppress_results=self._in_echo_window,
             )
             if self._audio_queue is not None:
                 print("[STT] Session ended unexpectedly — reconnecting in 1 s…")
@@ -334,27 +525,77 @@ class Orchestrator:
                         break
                 await asyncio.sleep(1.0)
 
+    def _put_audio_chunk(self, chunk: bytes | None) -> None:
+        """
+        Enqueue a mic chunk (or the None end-of-stream sentinel) with a
+        drop-oldest policy: when the queue is full the stalest chunk is
+        evicted so STT always works from the most recent audio.
+        """
+        q = self._audio_queue
+        if q is None:
+            return
+        try:
+            q.put_nowait(chunk)
+        except asyncio.QueueFull:
+            try:
+                q.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            q.put_nowait(chunk)
+            self._audio_dropped += 1
+            if self._audio_dropped % 50 == 1:
+                print(f"[Orchestrator] STT backlog: dropped {self._audio_dropped} mic chunk(s)")
+
+    async def handle_binary(self, frame: bytes) -> None:
+        """
+        Dispatch a binary WebSocket frame (1-byte opcode + payload).
+        Currently only mic audio uses this path; unknown opcodes are dropped.
+        """
+        if frame[:1] == _AUDIO_FRAME_PREFIX:
+            self._put_audio_chunk(frame[1:])
+
     async def _handle_audio_data(self, data: dict) -> None:
-        """Decode base64 audio chunk and push into the STT queue."""
+        """
+        Decode base64 audio chunk and push into the STT queue.
+        JSON fallback for clients that don't send binary audio frames.
+        """
         if self._audio_queue is None:
             return
         b64 = data.get("data", "")
         if b64:
-            audio_bytes = base64.b64decode(b64)
-            await self._audio_queue.put(audio_bytes)
+            # a2b_base64 is the thin C decoder under base64.b64decode — skips
+            # the wrapper's validation branches on a per-mic-chunk path.
+            self._put_audio_chunk(a2b_base64(b64))
 
     async def _handle_audio_stop(self) -> None:
         """Signal end-of-stream to Deepgram."""
         if self._audio_queue is not None:
-            await self._audio_queue.put(None)  # sentinel
+            self._put_audio_chunk(None)  # sentinel
             self._audio_queue = None
         # Flush any buffered final transcript when mic streaming stops.
         await self._flush_stt_buffer()
 
+    def _in_echo_window(self) -> bool:
+        """
+        True while Deepgram Results frames are presumed to be Ada's own voice
+        echoing back. Passed to the STT client so echoed frames are dropped
+        before they are even JSON-parsed. Frames are kept whenever an
+        auto-barge-in is pending — its confirmation needs a real transcript.
+        """
+        if self._pending_auto_barge_at is not None:
+            return False
+        return self._loop.time() - self._last_tts_sent_at < self._echo_cooldown
+
     async def _emit_barge_in(self) -> None:
         self._interrupted = True
         self._last_tts_sent_at = 0.0  # reset cooldown so barge-in transcript is processed
-        await self.websocket.send_json({"type": "barge_in"})
+        # Hard-cancel TTS still in flight: the _interrupted flag alone only
+        # drops chunks as they arrive, which keeps paying network and quota
+        # until the provider finishes (or stalls).
+        task = self._tts_task
+        if task is not None and not task.done():
+            task.cancel()
+        self._send({"type": "barge_in"})
 
     async def _on_speech_start(self, source: str = "stt") -> None:
         """
@@ -363,7 +604,7 @@ class Orchestrator:
         Set _interrupted so _dispatch_llm_response drops the rest of Ada's response.
         Also reset the echo cooldown so the upcoming transcript is not suppressed.
         """
-        now = time.time()
+        now = self._loop.time()
         if source == "manual":
             self._pending_auto_barge_at = None
             await self._emit_barge_in()
@@ -388,13 +629,12 @@ class Orchestrator:
         Called by STTClient when a final transcript arrives from Deepgram.
         Skips transcripts that arrive too soon after Ada's TTS (likely echo).
 
-        Uses create_task rather than awaiting _handle_transcript directly so the
-        STT recv loop is never blocked — Deepgram messages (including the next
-        SpeechStarted for another barge-in) keep flowing immediately.
-        The _llm_lock inside _handle_transcript serialises concurrent calls.
+        Never blocks the STT recv loop: buffering is synchronous, and the
+        eventual flush only enqueues a turn request for the turn worker —
+        Deepgram messages (including the next SpeechStarted for another
+        barge-in) keep flowing immediately.
         """
-        import time as _time
-        now = _time.time()
+        now = self._loop.time()
 
         # Confirm pending auto-barge-in only when we got a real transcript.
         if self._pending_auto_barge_at is not None:
@@ -404,39 +644,54 @@ class Orchestrator:
                 await self._emit_barge_in()
             self._pending_auto_barge_at = None
 
-        elapsed = _time.time() - self._last_tts_sent_at
+        elapsed = now - self._last_tts_sent_at
         if elapsed < self._echo_cooldown:
             print(f"STT echo suppressed ({elapsed:.2f}s after TTS): {text!r}")
             return
 
-        # Merge adjacent final chunks into one utterance.
-        self._stt_buffer.append(text.strip())
-        if self._stt_flush_task and not self._stt_flush_task.done():
-            self._stt_flush_task.cancel()
-        self._stt_flush_task = asyncio.create_task(self._flush_stt_buffer_after_delay())
+        # Merge adjacent final chunks into one utterance. Empties are skipped
+        # here so the flush can join the buffer without re-filtering.
+        stripped = text.strip()
+        if not stripped:
+            return
+        self._stt_buffer.append(stripped)
+        self._stt_deadline = now + self._stt_merge_window_sec
+        self._stt_wakeup.set()
 
-    async def _flush_stt_buffer_after_delay(self) -> None:
-        try:
-            await asyncio.sleep(self._stt_merge_window_sec)
+    async def _stt_debounce_loop(self) -> None:
+        """
+        Persistent debouncer for the STT merge buffer. Each buffered chunk
+        pushes the deadline forward and sets the wakeup event; once the
+        deadline passes with no new chunk, the buffer is flushed. One
+        long-lived task instead of a cancel-and-recreate sleeper per chunk.
+        """
+        while True:
+            await self._stt_wakeup.wait()
+            self._stt_wakeup.clear()
+            while True:
+                remaining = self._stt_deadline - self._loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    # A new chunk extends the deadline and re-sets the event.
+                    await asyncio.wait_for(self._stt_wakeup.wait(), remaining)
+                    self._stt_wakeup.clear()
+                except asyncio.TimeoutError:
+                    break
             await self._flush_stt_buffer()
-        except asyncio.CancelledError:
-            return
 
     async def _flush_stt_buffer(self) -> None:
-        parts = [p for p in self._stt_buffer if p]
-        if not parts:
-            return
-        self._stt_buffer = []
-        merged = " ".join(parts).strip()
-        if not merged:
+        buf = self._stt_buffer
+        if not buf:
             return
+        # Chunks are stripped and non-empty on append — join once and go.
+        merged = " ".join(buf)
+        buf.clear()
 
-        try:
-            await self.websocket.send_json({"type": "transcript_interim", "text": merged})
-            asyncio.create_task(self._handle_transcript({"text": merged}))
-        except Exception:
-            # WebSocket already closed — discard silently
-            pass
+        self._send({"type": "transcript_interim", "text": merged})
+        # _handle_transcript only records the turn and feeds the turn queue —
+        # the worker does the LLM call — so no fire-and-forget task is needed.
+        await self._handle_transcript({"text": merged})
 
     # ── Board state helpers ───────────────────────────────────────────────────
 
@@ -451,19 +706,35 @@ class Orchestrator:
         if not ctx or not messages:
             return messages
 
-        # Find the last user message and append the note to its content.
-        for i in reversed(range(len(messages))):
-            if messages[i]["role"] == "user":
-                messages = list(messages)  # shallow copy to avoid mutating session state
-                messages[i] = dict(messages[i], content=messages[i]["content"] + f"\n{ctx}")
-                break
-        return messages
+        # Append the note to the last user message. That is virtually always
+        # the final message (the turn that triggered this call), so the scan
+        # usually stops immediately. Build the patched list in one slice-concat
+        # rather than copying and then reassigning — the session's cached list
+        # must never be mutated.
+        idx = len(messages) - 1
+        while idx >= 0 and messages[idx]["role"] != "user":
+            idx -= 1
+        if idx < 0:
+            return messages
+        patched = dict(messages[idx], content=messages[idx]["content"] + f"\n{ctx}")
+        return [*messages[:idx], patched, *messages[idx + 1:]]
 
-    def _normalize_board_actions(self, board_actions: list) -> list:
+    def _prepare_board_actions(self, board_actions: list) -> list:
         """
-        Normalize LLM board actions into drawable lines that fit the board width.
-        Splits long write content into wrapped line actions to avoid right-edge
-        clipping and accidental overlap from unhandled newlines.
+        Normalize and rebase LLM board actions in one fused pass.
+
+        Long write content is wrapped into per-line write actions that fit the
+        board width, and the viewport-relative y-coordinates the LLM emits are
+        translated into world (page) coordinates, placing new content below
+        both Ada's previous writing AND any student shapes on the canvas.
+
+        When the remaining space in the current viewport is too small, a
+        'scroll_board' sentinel is prepended instead of clearing — the frontend
+        will pan the camera down to reveal fresh blank space below.
+
+        Replaces the former normalize-then-rebase pair: wrapping is staged
+        without interim action dicts, and the final dicts are built once with
+        their final coordinates.
         """
         if not board_actions:
             return []
@@ -472,134 +743,113 @@ class Orchestrator:
         # Caveat handwriting averages roughly 12-14 px per character.
         chars_per_line = max(18, min(80, int(usable_width / 13)))
         line_step = 62
+        wrapper = _wrapper(chars_per_line)
 
-        normalized: list = []
+        # First walk: wrap write content and record the y-range the rendered
+        # lines will span. Non-write actions stage through untouched.
+        staged: list[tuple] = []  # ("write", lines, base_y, fmt, color) | ("other", action)
+        min_y: float | None = None
+        max_y = 0.0
         for action in board_actions:
             if action.get("type") != "write":
-                normalized.append(action)
+                staged.append(("other", action))
                 continue
 
             raw_content = action.get("content", "")
             content = raw_content if isinstance(raw_content, str) else str(raw_content)
-            if not content.strip():
+            stripped = content.strip()
+            if not stripped:
                 continue
 
             pos = action.get("position")
-            if isinstance(pos, dict):
-                base_x = float(pos.get("x", 20))
+            if isinstance(pos, dict) and isinstance(pos.get("y"), (int, float)):
                 base_y = float(pos.get("y", 140))
             else:
-                base_x, base_y = 20.0, 140.0
-
-            # Always write from the left edge; ignore any x the LLM provided.
-            base_x = self._write_start_x
-
-            logical_lines = [ln.strip() for ln in content.splitlines() if ln.strip()]
-            if not logical_lines:
-                logical_lines = [content.strip()]
+                base_y = 140.0
+
+            # Common case: single-line content — the outer strip already did
+            # the work, skip splitlines and the per-line re-strip entirely.
+            if "\n" in stripped:
+                logical_lines: tuple | list = [
+                    s for s in (ln.strip() for ln in stripped.splitlines()) if s
+                ]
+            else:
+                logical_lines = (stripped,)
 
-            rendered_lines: list[str] = []
+            lines: list[str] = []
             for line in logical_lines:
-                wrapped = textwrap.wrap(
-                    line,
-                    width=chars_per_line,
-                    break_long_words=False,
-                    break_on_hyphens=False,
-                )
-                rendered_lines.extend(wrapped or [line])
-
-            color = action.get("color", "#000000")
-            fmt = action.get("format", "text")
-            for idx, line in enumerate(rendered_lines):
-                normalized.append(
+                lines.extend(wrapper.wrap(line) or [line])
+
+            # Coerce format/color here, once — this pass is the single
+            # validation point, so the synth path downstream can index the
+            # emitted dicts directly without re-checking types.
+            fmt = action.get("format")
+            color = action.get("color")
+            staged.append(
+                ("write", lines, base_y,
+                 fmt if fmt in ("text", "latex") else "text",
+                 color if isinstance(color, str) and color else "#000000")
+            )
+            if min_y is None or base_y < min_y:
+                min_y = base_y
+            last_y = base_y + (len(lines) - 1) * line_step
+            if last_y > max_y:
+                max_y = last_y
+
+        # Decide the world-space shift before emitting the final dicts.
+        offset = 0
+        scroll_by = 0
+        fresh_canvas = (
+            self.session.board_next_y == 0 and self.session.board_viewport_y == 0
+        )
+        if min_y is not None and not fresh_canvas:
+            content_height = max_y - min_y
+
+            # The "cursor" is the lowest world-y where any content (Ada's or
+            # the student's) currently lives. Start Ada's next write below it,
+            # clamped so we never start above the top margin of the page.
+            effective_cursor_world_y = max(
+                self.session.board_next_y,
+                self.session.student_content_bottom_y,
+            )
+            viewport_start_y = self.session.board_viewport_y + 140
+            target_world_y = max(effective_cursor_world_y + 20, viewport_start_y)
+
+            board_limit_y = self.session.board_viewport_y + self.session.board_height - 20
+            if target_world_y + content_height > board_limit_y:
+                # Not enough room — scroll down one full board-height.
+                scroll_by = self.session.board_height
+                self.session.board_viewport_y += scroll_by
+                self.session.board_next_y = self.session.board_viewport_y
+                self.session.student_content_bottom_y = 0  # fresh page
+                offset = int(self.session.board_viewport_y + 140 - min_y)
+            elif min_y < target_world_y:
+                offset = int(target_world_y - min_y)
+            # else: LLM's y already lands in the right place (no shift needed).
+
+        # Second walk: emit the final action dicts once, already positioned.
+        result: list = []
+        if scroll_by:
+            result.append({"type": "scroll_board", "scroll_by": scroll_by})
+        for item in staged:
+            if item[0] == "other":
+                result.append(item[1])
+                continue
+            _, lines, base_y, fmt, color = item
+            for idx, line in enumerate(lines):
+                result.append(
                     {
                         "type": "write",
                         "content": line,
                         "format": fmt,
-                        "position": {"x": base_x, "y": base_y + idx * line_step},
+                        # Always write from the left edge; ignore any LLM x.
+                        "position": {
+                            "x": self._write_start_x,
+                            "y": base_y + idx * line_step + offset,
+                        },
                         "color": color,
                     }
                 )
-
-        return normalized
-
-    def _rebase_board_actions(self, board_actions: list) -> list:
-        """
-        Shift write-action y-coordinates (which the LLM always gives as
-        viewport-relative) into world (page) coordinates, placing new content
-        below both Ada's previous writing AND any student shapes on the canvas.
-
-        When the remaining space in the current viewport is too small, a
-        'scroll_board' sentinel is prepended instead of clearing — the frontend
-        will pan the camera down to reveal fresh blank space below.
-        """
-        write_actions = [a for a in board_actions if a.get("type") == "write"]
-        if not write_actions:
-            return board_actions
-
-        # On a completely fresh canvas (no prior writing, no scroll) let the LLM's
-        # y=140 stand as-is; no translation needed.
-        if self.session.board_next_y == 0 and self.session.board_viewport_y == 0:
-            return board_actions
-
-        ys = [
-            a["position"]["y"]
-            for a in write_actions
-            if isinstance(a.get("position"), dict)
-            and isinstance(a["position"].get("y"), (int, float))
-        ]
-        if not ys:
-            return board_actions
-
-        min_y = min(ys)  # smallest LLM y (viewport-relative, usually 140)
-        content_height = max(ys) - min_y
-
-        # The "cursor" is the lowest world-y where any content (Ada's or the
-        # student's) currently lives.  We start Ada's next write below it.
-        effective_cursor_world_y = max(
-            self.session.board_next_y,
-            self.session.student_content_bottom_y,
-        )
-        # Clamp so we never start above the standard top margin of the current page.
-        viewport_start_y = self.session.board_viewport_y + 140
-        target_world_y = max(effective_cursor_world_y + 20, viewport_start_y)
-
-        # Check if this placement fits inside the current visible page.
-        board_limit_y = self.session.board_viewport_y + self.session.board_height - 20
-        if target_world_y + content_height > board_limit_y:
-            # Not enough room — scroll down one full board-height.
-            scroll_by = self.session.board_height
-            self.session.board_viewport_y += scroll_by
-            self.session.board_next_y = self.session.board_viewport_y
-            self.session.student_content_bottom_y = 0  # fresh page
-
-            new_target_world_y = self.session.board_viewport_y + 140
-            new_offset = int(new_target_world_y - min_y)
-
-            result: list = [{"type": "scroll_board", "scroll_by": scroll_by}]
-            for action in board_actions:
-                if action.get("type") == "write" and isinstance(action.get("position"), dict):
-                    action = dict(action, position={
-                        "x": self._write_start_x,  # always left-aligned
-                        "y": action["position"]["y"] + new_offset,
-                    })
-                result.append(action)
-            return result
-
-        # Normal rebase: translate LLM y-values to world coordinates.
-        if min_y >= target_world_y:
-            # LLM's y already lands in the right place (no shift needed).
-            return board_actions
-
-        offset = int(target_world_y - min_y)
-        result = []
-        for action in board_actions:
-            if action.get("type") == "write" and isinstance(action.get("position"), dict):
-                action = dict(action, position={
-                    "x": self._write_start_x,  # always left-aligned
-                    "y": action["position"]["y"] + offset,
-                })
-            result.append(action)
         return result
 
     def _stroke_payload_bottom_y(self, payload: dict) -> int | None:
@@ -637,7 +887,7 @@ class Orchestrator:
         response knows where free space starts.
 
         sent_items are tuples of: (message_type, payload, original_action).
-        'scroll_board' resets are already applied inside _rebase_board_actions,
+        'scroll_board' resets are already applied inside _prepare_board_actions,
         so we only need to advance the cursor for actual write actions here.
         """
         max_y = self.session.board_next_y
@@ -645,7 +895,7 @@ class Orchestrator:
             action_type = action.get("type")
 
             if action_type in ("clear", "scroll_board"):
-                # State already updated by _rebase_board_actions or by the
+                # State already updated by _prepare_board_actions or by the
                 # board_action handler on the frontend (clear resets canvas).
                 # Reflect whatever the session now records.
                 max_y = self.session.board_next_y
@@ -671,34 +921,209 @@ class Orchestrator:
 
     # ── LLM response dispatch ────────────────────────────────────────────────
 
+    @staticmethod
+    def _split_tts_chunks(text: str) -> list[str]:
+        """
+        Split speech at sentence boundaries for parallel TTS, merging adjacent
+        short sentences so no chunk is a throwaway two-word request. Returns a
+        single-element list when the text is short enough to synthesize whole.
+        """
+        if len(text) < _TTS_SPLIT_MIN_CHARS:
+            return [text]
+        chunks: list[str] = []
+        for m in _TTS_SENTENCE_RE.finditer(text):
+            sentence = m.group().strip()
+            if not sentence:
+                continue
+            if chunks and len(chunks[-1]) < _TTS_MIN_CHUNK_CHARS:
+                chunks[-1] = f"{chunks[-1]} {sentence}"
+            else:
+                chunks.append(sentence)
+        return chunks or [text]
+
+    async def _tts_chunk_source(self, text: str):
+        """
+        Yield PCM chunks for `text` in playback order.
+
+        Single sentence: pass the provider stream straight through. Multiple
+        sentences: synthesize them concurrently (capped by a semaphore) into
+        per-sentence queues, and drain the queues in order — sentence 0 plays
+        while sentences 1..n are still in flight, cutting time-to-first-audio
+        for long speech to the latency of the first sentence alone.
+        """
+        chunks = self._split_tts_chunks(text)
+        if len(chunks) == 1:
+            async for chunk in self.tts.stream(chunks[0]):
+                yield chunk
+            return
+
+        sem = asyncio.Semaphore(_TTS_MAX_CONCURRENCY)
+        queues: list[asyncio.Queue] = [asyncio.Queue() for _ in chunks]
+
+        async def synth(sentence: str, out: asyncio.Queue) -> None:
+            try:
+                async with sem:
+                    async for chunk in self.tts.stream(sentence):
+                        out.put_nowait(chunk)
+            except Exception as exc:
+                print(f"[TTS] sentence synth failed: {exc}")
+            finally:
+                out.put_nowait(None)  # end-of-sentence sentinel
+
+        tasks = [
+            self._loop.create_task(synth(s, q)) for s, q in zip(chunks, queues)
+        ]
+        try:
+            for q in queues:
+                while True:
+                    chunk = await q.get()
+                    if chunk is None:
+                        break
+                    yield chunk
+        finally:
+            # Barge-in (or an error downstream) closes this generator —
+            # cancel the in-flight synth requests so they stop burning
+            # network and quota on audio nobody will hear.
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
     async def _stream_tts_chunks(self, text: str, started: asyncio.Event) -> None:
         """
         Stream TTS bytes to the client as they arrive so playback can begin
-        before full synthesis completes.
+        before full synthesis completes. Long speech is synthesized sentence-
+        by-sentence in parallel (see _tts_chunk_source); this sender only sees
+        one ordered chunk stream either way.
         """
-        first_chunk_sent = False
+        any_sent = False
+        source = self._tts_chunk_source(text)
         try:
-            async for chunk in self.tts.stream(text):
+            stream = source.__aiter__()
+
+            # Consume up to the first non-empty chunk separately so the
+            # begin-of-speech state is set exactly once, keeping the per-chunk
+            # loop free of first-iteration branches.
+            first: bytes | None = None
+            async for chunk in stream:
+                if self._interrupted:
+                    return
+                if chunk:
+                    first = chunk
+                    break
+            if first is None:
+                return
+
+            now = self._loop.time()
+            self._last_tts_started_at = now
+            self._last_tts_sent_at = now
+            self._tts_active = True
+            any_sent = True
+            # Raw PCM as a binary frame — no base64 inflation, no JSON.
+            self._send(_AUDIO_FRAME_PREFIX + first)
+            started.set()
+
+            i = 0
+            async for chunk in stream:
                 if self._interrupted:
                     break
                 if not chunk:
                     continue
-                audio_b64 = base64.b64encode(chunk).decode("utf-8")
-                await self.websocket.send_json({"type": "audio_chunk", "data": audio_b64})
-                if not first_chunk_sent:
-                    self._last_tts_started_at = time.time()
-                    self._tts_active = True
-                self._last_tts_sent_at = time.time()
-                if not first_chunk_sent:
-                    first_chunk_sent = True
-                    started.set()
+                self._send(_AUDIO_FRAME_PREFIX + chunk)
+                # The echo cooldown only needs coarse freshness — stamp every
+                # 4th chunk instead of calling time.time() twice per chunk.
+                # finally puts down an exact final stamp.
+                if i & 3 == 0:
+                    self._last_tts_sent_at = self._loop.time()
+                i += 1
         except Exception as exc:
             print(f"[TTS] stream failed: {exc}")
         finally:
+            # Close the source promptly (don't wait for GC) so a barge-in
+            # cancels any sentence synthesis still in flight.
+            await source.aclose()
             self._tts_active = False
             self._pending_auto_barge_at = None
+            if any_sent:
+                self._last_tts_sent_at = self._loop.time()
             started.set()
 
+    async def _synth_action(self, action: dict) -> tuple[str, dict, int]:
+        """
+        Turn one board action into its outbound (msg_type, payload, total_pts)
+        triple. total_pts is the stroke point count for write actions (used by
+        the animation-speed calibration) and 0 for everything else.
+        """
+        if action.get("type") != "write":
+            if action.get("type") == "scroll_board":
+                # Pass the sentinel through — handled separately when sending.
+                return ("scroll_board", action, 0)
+            return ("board_action", action, 0)
+
+        # Write actions reaching this point were emitted by
+        # _prepare_board_actions, which validated and coerced every field —
+        # index directly instead of re-guarding each one per action.
+        text_content = action["content"]
+        position = action["position"]
+        color = action["color"]
+
+        if action["format"] == "latex":
+            max_width = max(240.0, float(self.session.board_width - 180))
+            stroke_data = await self.latex.convert(
+                latex=text_content,
+                color=color,
+                position=position,
+                max_width_px=max_width,
+            )
+        else:
+            stroke_data = await self._synth_text(text_content, color, position)
+        # Count points here, off the dataclass, so calibration never rescans
+        # the nested payload dicts.
+        total_pts = sum(len(s.points) for s in stroke_data.strokes)
+        return ("strokes", stroke_data.to_dict(), total_pts)
+
+    async def _synth_text(
+        self, text: str, color: str, position: dict
+    ) -> StrokeData:
+        """
+        Font-synthesize one write line, through the origin-frame LRU for
+        short tokens. Synthesis is sync CPU work (fontTools + skeleton cache)
+        and runs on the handwriting pool so the loop keeps serving audio and
+        transcript traffic; positional args because run_in_executor takes no
+        kwargs and a lambda would just add overhead. Cache hits skip the pool
+        entirely — one vectorized translation of the stored arrays.
+        """
+        if len(text) > _HW_CACHE_MAX_CHARS:
+            return await self._loop.run_in_executor(
+                self._hw_pool, self.handwriting.synthesize, text, color, position
+            )
+
+        key = (text, color)
+        cached = self._hw_cache.get(key)
+        if cached is None:
+            origin = await self._loop.run_in_executor(
+                self._hw_pool,
+                self.handwriting.synthesize,
+                text,
+                color,
+                {"x": 0.0, "y": 0.0},
+            )
+            cached = (origin, sum(len(s.points) for s in origin.strokes))
+            self._hw_cache[key] = cached
+            if len(self._hw_cache) > _HW_CACHE_MAX:
+                self._hw_cache.popitem(last=False)
+        else:
+            self._hw_cache.move_to_end(key)
+
+        origin, _pts = cached
+        shift = np.array([position["x"], position["y"], 0.0], dtype=np.float32)
+        return StrokeData(
+            strokes=[
+                Stroke(points=s.points + shift, color=s.color, width=s.width)
+                for s in origin.strokes
+            ],
+            position=position,
+        )
+
     async def _dispatch_llm_response(
         self,
         llm_response: dict,
@@ -720,7 +1145,7 @@ class Orchestrator:
         """
         speech = llm_response.get("speech", "")
         raw_actions = llm_response.get("board_actions", [])
-        board_actions = self._rebase_board_actions(self._normalize_board_actions(raw_actions))
+        board_actions = self._prepare_board_actions(raw_actions)
         tutor_state = llm_response.get("tutor_state", "listening")
 
         self.session.tutor_mode = tutor_state
@@ -728,63 +1153,41 @@ class Orchestrator:
         # Fallback: start TTS if on_speech_ready didn't fire (e.g. empty speech).
         if speech and tts_task is None:
             self.session.add_assistant_turn(speech, time.time())
-            await self.websocket.send_json({"type": "speech_text", "text": speech})
+            self._send({"type": "speech_text", "text": speech})
             tts_started = asyncio.Event()
             tts_task = asyncio.create_task(self._stream_tts_chunks(speech, tts_started))
+            self._tts_task = tts_task
 
         # ── Step 1: Synthesize all strokes, collect without sending yet ──────
+        # gather so LaTeX renders (network) and handwriting synths (thread
+        # pool) overlap instead of serialising — results come back in order.
+        # Multi-equation responses first warm the SVG cache with one batched
+        # MathJax POST, so the per-action convert() calls below all hit it
+        # instead of racing N separate renders.
+        latex_exprs = [
+            a["content"]
+            for a in board_actions
+            if a.get("type") == "write" and a["format"] == "latex"
+        ]
+        if len(latex_exprs) > 1:
+            await self.latex.prewarm(latex_exprs)
         print(f"[Orchestrator] Processing {len(board_actions)} board_action(s)")
-        pending: list[tuple[str, dict]] = []  # (msg_type, payload)
-
-        for action in board_actions:
-            if action.get("type") == "write":
-                raw_content = action.get("content", "")
-                text_content = raw_content if isinstance(raw_content, str) else str(raw_content)
-                content_format = action.get("format", "text")
-
-                raw_pos = action.get("position", {})
-                if isinstance(raw_pos, dict):
-                    position = {
-                        "x": float(raw_pos.get("x", 100)),
-                        "y": float(raw_pos.get("y", 100)),
-                    }
-                else:
-                    position = {"x": 100, "y": 100}
-
-                if content_format == "latex":
-                    max_width = max(240.0, float(self.session.board_width - 180))
-                    stroke_data = await self.latex.convert(
-                        latex=text_content,
-                        color=action.get("color", "#000000"),
-                        position=position,
-                        max_width_px=max_width,
-                    )
-                else:
-                    stroke_data = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda t=text_content, c=action.get("color", "#000000"), p=position: (
-                            self.handwriting.synthesize(text=t, color=c, position=p)
-                        ),
-                    )
-                pending.append(("strokes", stroke_data.to_dict()))
-            elif action.get("type") == "scroll_board":
-                # Pass the sentinel through — handled separately when sending.
-                pending.append(("scroll_board", action))
-            else:
-                pending.append(("board_action", action))
+        pending: list[tuple[str, dict, int]] = list(
+            await asyncio.gather(*(self._synth_action(a) for a in board_actions))
+        )
 
         # ── Step 2: Calibrate animation speed to match speech duration ────────
         # Estimate how long Ada will speak (~2.4 words/second, min 1.5 s).
         # Spread that time evenly across all write actions so writing finishes
-        # at roughly the same moment as speaking.
-        write_payloads = [p for typ, p in pending if typ == "strokes"]
+        # at roughly the same moment as speaking. Point totals were counted
+        # during synthesis, so no rescan of the nested stroke dicts here.
+        write_payloads = [(p, n) for typ, p, n in pending if typ == "strokes"]
         if write_payloads and speech:
             speech_words = len(speech.split())
             speech_duration = max(1.5, speech_words / 2.4)
             target_per_action = speech_duration / len(write_payloads)
 
-            for payload in write_payloads:
-                total_pts = sum(len(s["points"]) for s in payload["strokes"])
+            for payload, total_pts in write_payloads:
                 if total_pts > 0:
                     # animation_speed = points drawn per frame pair at 60 fps
                     payload["animation_speed"] = max(
@@ -802,19 +1205,19 @@ class Orchestrator:
         # Stop early if the user barged in; track only the actions actually sent
         # so the board cursor reflects what was genuinely drawn.
         sent_items: list[tuple[str, dict, dict]] = []
-        for (msg_type, payload), action in zip(pending, board_actions):
+        for (msg_type, payload, _pts), action in zip(pending, board_actions):
             if self._interrupted:
                 break  # student is speaking — drop remaining strokes
             if msg_type == "strokes":
-                await self.websocket.send_json({"type": "strokes", "strokes": payload})
+                self._send({"type": "strokes", "strokes": payload})
             elif msg_type == "scroll_board":
                 # Tell the frontend to pan the camera down; no canvas content to send.
-                await self.websocket.send_json({
+                self._send({
                     "type": "scroll_board",
                     "scroll_by": payload.get("scroll_by", self.session.board_height),
                 })
             else:
-                await self.websocket.send_json({"type": "board_action", "action": payload})
+                self._send({"type": "board_action", "action": payload})
             sent_items.append((msg_type, payload, action))
 
         # Update board cursor only for actions that were actually drawn.
@@ -824,7 +1227,7 @@ class Orchestrator:
         # the student (so the UI can show a "your turn" cue).
         wait_for_student = llm_response.get("wait_for_student", False)
         self._wait_for_student = bool(wait_for_student)
-        await self.websocket.send_json({
+        self._send({
             "type": "state_update",
             "tutor_state": tutor_state,
             "wait_for_student": wait_for_student,
@@ -832,4 +1235,10 @@ class Orchestrator:
 
         # Ensure background TTS task errors are surfaced in this handler.
         if tts_task is not None:
-            await tts_task
+            try:
+                await tts_task
+            except asyncio.CancelledError:
+                # Barge-in cancelled the synthesis mid-flight — expected.
+                # Re-raise only if this coroutine itself is being cancelled.
+                if not tts_task.cancelled():
+                    raise
@@ -1,14 +1,32 @@
+from binascii import b2a_base64
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Literal
 
 TutorMode = Literal["listening", "guiding", "demonstrating", "evaluating"]
 
+# Rolling window for conversation history. Without a cap, prompt tokens (and
+# LLM time-to-first-token) grow linearly for the whole session; tutoring
+# context older than this rarely changes Ada's next reply.
+MAX_HISTORY_TURNS = 40
+
 
 @dataclass
 class BoardSnapshot:
-    image_base64: str
+    # Raw PNG bytes — base64 would inflate every retained snapshot by ~33%.
+    image_bytes: bytes
     timestamp: float
     description: str = ""
+    # Lazy base64 memo — snapshots that are never sent to the LLM never pay
+    # the encode, and ones sent on several turns pay it once. Returning the
+    # same str object also lets the LLM client memoize its digest by identity.
+    _b64: str | None = field(default=None, repr=False)
+
+    def as_base64(self) -> str:
+        """Encode for the Anthropic vision payload, cached after first use."""
+        if self._b64 is None:
+            self._b64 = b2a_base64(self.image_bytes, newline=False).decode()
+        return self._b64
 
 
 @dataclass
@@ -24,7 +42,11 @@ class TutorSession:
     conversation_history: list[ConversationTurn] = field(default_factory=list)
     current_subject: str = ""
     tutor_mode: TutorMode = "listening"
-    board_snapshots: list[BoardSnapshot] = field(default_factory=list)
+    # Ring of the most recent snapshots — deque(maxlen) evicts the oldest on
+    # append in O(1), instead of re-slicing the list on every snapshot.
+    board_snapshots: deque[BoardSnapshot] = field(
+        default_factory=lambda: deque(maxlen=10)
+    )
     student_progress: dict = field(default_factory=dict)
     is_active: bool = False
 
@@ -37,6 +59,14 @@ class TutorSession:
     board_width: int = 1200
     board_height: int = 700
 
+    # Incremental cache for to_anthropic_messages — holds already-converted
+    # turns so each LLM call only converts what was added since the last one.
+    _msgs_cache: list = field(default_factory=list, repr=False)
+
+    # Running total of turns dropped by the rolling-window trim, surfaced to
+    # the LLM in the elision marker so Ada knows earlier context existed.
+    _elided_turn_count: int = field(default=0, repr=False)
+
     def get_board_state_context(self) -> str:
         """
         Return a short note for the LLM describing the current whiteboard state.
@@ -64,22 +94,59 @@ class TutorSession:
         self.conversation_history.append(
             ConversationTurn(role="user", content=text, timestamp=timestamp)
         )
+        self._trim_history()
 
     def add_assistant_turn(self, text: str, timestamp: float = 0.0) -> None:
         self.conversation_history.append(
             ConversationTurn(role="assistant", content=text, timestamp=timestamp)
         )
+        self._trim_history()
 
-    def add_board_snapshot(self, image_base64: str, timestamp: float) -> None:
-        snapshot = BoardSnapshot(image_base64=image_base64, timestamp=timestamp)
-        self.board_snapshots.append(snapshot)
-        # Keep only the last 10 snapshots to limit memory
-        if len(self.board_snapshots) > 10:
-            self.board_snapshots = self.board_snapshots[-10:]
+    def _trim_history(self) -> None:
+        """
+        Keep only the newest MAX_HISTORY_TURNS turns so per-call prompt cost
+        stays bounded for arbitrarily long sessions. The kept window always
+        starts on a user turn (preserving the alternating structure the API
+        expects), and an elision marker is folded into that first turn so Ada
+        knows earlier conversation existed.
+        """
+        history = self.conversation_history
+        if len(history) <= MAX_HISTORY_TURNS:
+            return
+        cut = len(history) - MAX_HISTORY_TURNS
+        while cut < len(history) and history[cut].role != "user":
+            cut += 1
+        if cut <= 0 or cut >= len(history):
+            return
+        self._elided_turn_count += cut
+        del history[:cut]
+        first = history[0]
+        first.content = (
+            f"[Earlier conversation trimmed: {self._elided_turn_count} older "
+            f"turn(s) omitted.]\n{first.content}"
+        )
+        # A front trim shifts every index — the incremental cache is stale
+        # top to bottom, so force a full rebuild on the next conversion.
+        self._msgs_cache.clear()
+
+    def add_board_snapshot(self, image_bytes: bytes, timestamp: float) -> None:
+        snapshot = BoardSnapshot(image_bytes=image_bytes, timestamp=timestamp)
+        self.board_snapshots.append(snapshot)  # maxlen evicts the oldest
 
     def to_anthropic_messages(self) -> list[dict]:
-        """Convert conversation history to Anthropic API message format."""
-        messages = []
-        for turn in self.conversation_history:
-            messages.append({"role": turn.role, "content": turn.content})
-        return messages
+        """
+        Convert conversation history to Anthropic API message format.
+
+        Incrementally cached: only turns appended since the previous call are
+        converted, so long chats stop paying O(history) per LLM call. The
+        orchestrator can pop a trailing synthetic turn, so a history shorter
+        than the cache triggers a full rebuild. Callers must treat the
+        returned list as read-only (copy before mutating).
+        """
+        history = self.conversation_history
+        cache = self._msgs_cache
+        if len(history) < len(cache):
+            cache.clear()
+        for turn in history[len(cache):]:
+            cache.append({"role": turn.role, "content": turn.content})
+        return cache
@@ -1,12 +1,13 @@
 import asyncio
-import json
 import os
 import ssl
+from collections import deque
 from collections.abc import Callable, Coroutine
 from typing import Any
 
 import aiohttp
 import certifi
+import orjson
 
 _SSL_CTX = ssl.create_default_context(cafile=certifi.where())
 
@@ -26,6 +27,52 @@ MIN_SINGLE_WORD_CONFIDENCE = float(os.getenv("STT_SINGLE_WORD_MIN_CONFIDENCE", "
 FINAL_AFTER_CLOSE_WAIT_SEC = float(os.getenv("STT_FINAL_AFTER_CLOSE_WAIT_SEC", "2.5"))
 
 
+class AudioChunkQueue:
+    """
+    Single-producer/single-consumer queue for mic audio chunks.
+
+    The mic path has exactly one producer (the WebSocket handler) and one
+    consumer (_send_audio), so asyncio.Queue's general machinery — a lock-free
+    waiter deque for multiple getters AND putters, plus unfinished-task
+    accounting for join() — is overhead with no users. This keeps the same
+    surface the STT path relies on (put_nowait/QueueFull, get, get_nowait/
+    QueueEmpty, empty) over a plain deque and one wakeup event.
+    """
+
+    __slots__ = ("_items", "_maxsize", "_event")
+
+    def __init__(self, maxsize: int = 0):
+        self._items: deque[bytes | None] = deque()
+        self._maxsize = maxsize
+        self._event = asyncio.Event()
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def put_nowait(self, item: bytes | None) -> None:
+        if 0 < self._maxsize <= len(self._items):
+            raise asyncio.QueueFull
+        self._items.append(item)
+        self._event.set()
+
+    def get_nowait(self) -> bytes | None:
+        items = self._items
+        if not items:
+            raise asyncio.QueueEmpty
+        item = items.popleft()
+        if not items:
+            self._event.clear()
+        return item
+
+    async def get(self) -> bytes | None:
+        # Loop rather than assume: the consumer may drain via get_nowait
+        # between the wakeup and this coroutine resuming.
+        while not self._items:
+            self._event.clear()
+            await self._event.wait()
+        return self.get_nowait()
+
+
 class STTClient:
     """
     Deepgram Nova-2 streaming STT proxy with barge-in support.
@@ -36,14 +83,22 @@ class STTClient:
                                    (use this for barge-in: stop Ada immediately)
     """
 
+    # Constant Deepgram control frames — no reason to json.dumps a literal
+    # dict per send (KeepAlive repeats every 8 s for as long as the mic is
+    # open; CloseStream fires once per teardown).
+    _KEEPALIVE_FRAME = '{"type": "KeepAlive"}'
+    _CLOSE_FRAME = '{"type": "CloseStream"}'
+
     def __init__(self):
         self.api_key = os.getenv("DEEPGRAM_API_KEY", "").strip()
         self.enabled = bool(self.api_key)
+        # The auth header never changes — build it once, not per reconnect.
+        self._headers = {"Authorization": f"Token {self.api_key}"}
         self.model = os.getenv("DEEPGRAM_MODEL", "nova-2").strip() or "nova-2"
         self.endpointing_ms = int(os.getenv("DEEPGRAM_ENDPOINTING_MS", "300"))
-
-    def build_url(self) -> str:
-        return (
+        # Static query prefix — model/language/VAD flags never change after
+        # construction, so only the encoding suffix is appended per stream.
+        self._url_base = (
             f"{DEEPGRAM_WS_URL}"
             f"?model={self.model}"
             "&language=en-US"
@@ -56,15 +111,60 @@ class STTClient:
             f"&endpointing={self.endpointing_ms}"
             # Keep interim results so SpeechStarted events arrive in time.
             "&interim_results=true"
-            "&encoding=opus"
-            "&container=webm"
+            # Push filtering server-side: drop filler words ("um", "uh")
+            # before they reach us, and don't hold finalized segments back
+            # waiting for smart_format context. The confidence/word-count
+            # filters in _recv_messages stay as the safety net.
+            "&filler_words=false"
+            "&no_delay=true"
+            # Cheap end-of-thought signal after 1 s of no speech; arrives as
+            # an UtteranceEnd frame the prefilter discards today, but keeps
+            # endpointing honest on trailing silence.
+            "&utterance_end_ms=1000"
         )
+        # One HTTP session for every Deepgram stream this client opens —
+        # keeping the connector alive lets reconnects reuse the TLS session
+        # instead of paying DNS + full handshake per audio_start.
+        self._session: aiohttp.ClientSession | None = None
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    ssl=_SSL_CTX,
+                    keepalive_timeout=300,
+                    # Cache Deepgram's DNS answer across reconnects — a
+                    # resolver round trip sits on the mic-open critical path.
+                    use_dns_cache=True,
+                    ttl_dns_cache=600,
+                    limit_per_host=8,
+                )
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Release the pooled HTTP session (called on orchestrator cleanup)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def build_url(self, encoding: str = "webm-opus", sample_rate: int = 16000) -> str:
+        base = self._url_base
+        if encoding == "linear16":
+            # Raw PCM16 from the AudioWorklet capture path — no Opus decode on
+            # Deepgram's side and no webm container handling anywhere.
+            return base + f"&encoding=linear16&sample_rate={sample_rate}&channels=1"
+        # MediaRecorder fallback path.
+        return base + "&encoding=opus&container=webm"
 
     async def stream_session(
         self,
-        audio_queue: asyncio.Queue,
+        audio_queue: AudioChunkQueue,
         on_final_transcript: Callable[[str], Coroutine[Any, Any, None]],
         on_speech_start: Callable[[], Coroutine[Any, Any, None]] | None = None,
+        encoding: str = "webm-opus",
+        sample_rate: int = 16000,
+        suppress_results: Callable[[], bool] | None = None,
     ) -> None:
         """
         Open a Deepgram WebSocket, forward audio from audio_queue, and fire
@@ -75,58 +175,36 @@ class STTClient:
         if not self.enabled:
             return
 
-        headers = {"Authorization": f"Token {self.api_key}"}
-
         try:
-            connector = aiohttp.TCPConnector(ssl=_SSL_CTX)
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.ws_connect(self.build_url(), headers=headers) as dg_ws:
-                    send_task = asyncio.create_task(self._send_audio(dg_ws, audio_queue))
-                    recv_task = asyncio.create_task(
-                        self._recv_messages(dg_ws, on_final_transcript, on_speech_start)
-                    )
-                    # Wait until either side finishes.
-                    done, pending = await asyncio.wait(
-                        [send_task, recv_task],
-                        return_when=asyncio.FIRST_COMPLETED,
+            session = await self._ensure_session()
+            url = self.build_url(encoding=encoding, sample_rate=sample_rate)
+            async with session.ws_connect(url, headers=self._headers) as dg_ws:
+                send_task = asyncio.create_task(self._send_audio(dg_ws, audio_queue))
+                try:
+                    # recv runs inline and ends naturally in every case: on a
+                    # server CLOSE/ERROR frame, or — after we send CloseStream
+                    # (PTT release) — on the deadline close the send side
+                    # schedules so Deepgram's last final Results still arrive.
+                    # One spawned task per session instead of two plus the
+                    # asyncio.wait / wait_for / cancel scaffolding.
+                    await self._recv_messages(
+                        dg_ws, on_final_transcript, on_speech_start,
+                        suppress_results,
                     )
-
-                    # If send finished first because we sent CloseStream (PTT release),
-                    # keep recv alive briefly so Deepgram can deliver final Results.
-                    send_finished = send_task in done and not send_task.cancelled()
-                    send_exc = send_task.exception() if send_finished else None
-                    if send_finished and send_exc is None and recv_task in pending:
-                        try:
-                            await asyncio.wait_for(recv_task, timeout=FINAL_AFTER_CLOSE_WAIT_SEC)
-                        except asyncio.TimeoutError:
-                            recv_task.cancel()
-                            try:
-                                await recv_task
-                            except (asyncio.CancelledError, Exception):
-                                pass
-                        except (asyncio.CancelledError, Exception):
-                            pass
-                    else:
-                        for task in pending:
-                            task.cancel()
-                            try:
-                                await task
-                            except (asyncio.CancelledError, Exception):
-                                pass
-
-                    # Surface any real exception from the finished tasks
-                    for task in done:
-                        if not task.cancelled():
-                            exc = task.exception()
-                            if exc is not None:
-                                raise exc
+                finally:
+                    if not send_task.done():
+                        send_task.cancel()
+                    try:
+                        await send_task  # surfaces real send errors
+                    except asyncio.CancelledError:
+                        pass
         except Exception as e:
             import traceback
             print(f"STT stream error: {e}")
             traceback.print_exc()
 
     async def _send_audio(
-        self, dg_ws: aiohttp.ClientWebSocketResponse, audio_queue: asyncio.Queue
+        self, dg_ws: aiohttp.ClientWebSocketResponse, audio_queue: AudioChunkQueue
     ) -> None:
         # Deepgram closes streaming connections after ~10 s of silence.
         # We send a KeepAlive JSON message every 8 s when no audio arrives so
@@ -142,32 +220,106 @@ class STTClient:
             except asyncio.TimeoutError:
                 # No audio chunk arrived — ping Deepgram to prevent idle timeout
                 try:
-                    await dg_ws.send_str(json.dumps({"type": "KeepAlive"}))
+                    await dg_ws.send_str(self._KEEPALIVE_FRAME)
                 except Exception:
                     break  # Deepgram WS already closed; exit cleanly
                 continue
 
             if chunk is None:
-                await dg_ws.send_str(json.dumps({"type": "CloseStream"}))
+                await dg_ws.send_str(self._CLOSE_FRAME)
+                break
+
+            # Coalesce backlog: when chunks queued up while a send was in
+            # flight, join a few into one WS frame — Deepgram accepts
+            # concatenated audio transparently, and one send means one pass
+            # through aiohttp's writer/masking/TLS framing instead of four.
+            # No backlog (the common case) still sends the lone chunk as-is.
+            closing = False
+            batch: list[bytes] | None = None
+            while (batch is None or len(batch) < 4) and not audio_queue.empty():
+                try:
+                    extra = audio_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if extra is None:
+                    closing = True
+                    break
+                if batch is None:
+                    batch = [chunk]
+                batch.append(extra)
+
+            await dg_ws.send_bytes(b"".join(batch) if batch else chunk)
+            if closing:
+                await dg_ws.send_str(self._CLOSE_FRAME)
                 break
-            await dg_ws.send_bytes(chunk)
+
+        # Deepgram delivers any buffered final Results after CloseStream;
+        # if the server hasn't closed the socket within the grace window,
+        # close it ourselves — that CLOSE frame is what ends the recv loop.
+        if not dg_ws.closed:
+            asyncio.get_running_loop().call_later(
+                FINAL_AFTER_CLOSE_WAIT_SEC,
+                lambda: None if dg_ws.closed else asyncio.ensure_future(dg_ws.close()),
+            )
 
     async def _recv_messages(
         self,
         dg_ws: aiohttp.ClientWebSocketResponse,
         on_final_transcript: Callable[[str], Coroutine[Any, Any, None]],
         on_speech_start: Callable[[], Coroutine[Any, Any, None]] | None,
+        suppress_results: Callable[[], bool] | None = None,
     ) -> None:
+        """
+        Consume Deepgram frames and dispatch SpeechStarted / final Results.
+
+        This loop runs for every frame Deepgram emits — mostly interim
+        Results and housekeeping that we discard — so it is written to be
+        allocation-bound, not parse-bound. Invariants to preserve when
+        touching it:
+
+        * A frame that will be discarded must never materialize a dict:
+          the substring prefilter decides on the raw string, and orjson
+          only runs on SpeechStarted candidates and final Results.
+        * No throwaway allocations per frame — no default {} / [] in
+          lookups, no .split() for counting, no tuples for type tests.
+        * SpeechStarted always passes the prefilter; suppress_results may
+          drop final Results (echo window) but never VAD events, or
+          barge-in confirmation breaks.
+        """
+        # Hoist the enum members out of the loop: per message this turns two
+        # module + class + member attribute chains (plus a throwaway tuple for
+        # the `in` test) into local loads and identity compares.
+        _TEXT = aiohttp.WSMsgType.TEXT
+        _CLOSE = aiohttp.WSMsgType.CLOSE
+        _ERROR = aiohttp.WSMsgType.ERROR
+
         async for msg in dg_ws:
-            # Exit cleanly on WebSocket close or error frames
-            if msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.ERROR):
-                break
-            if msg.type != aiohttp.WSMsgType.TEXT:
+            mtype = msg.type
+            if mtype is not _TEXT:
+                # Exit cleanly on WebSocket close or error frames
+                if mtype is _CLOSE or mtype is _ERROR:
+                    break
                 continue
 
+            raw = msg.data
+            # Cheap prefilter: the overwhelming majority of frames are interim
+            # Results (discarded on the is_final gate) and housekeeping
+            # (Metadata, UtteranceEnd, KeepAlive acks) — none of them worth a
+            # dict materialization. Only SpeechStarted candidates and frames
+            # that can carry a final transcript reach the parser. Deepgram
+            # serializes compactly, but tolerate a space after the colon.
+            if '"SpeechStarted"' not in raw:
+                if '"is_final":true' not in raw and '"is_final": true' not in raw:
+                    continue
+                # Echo window: while Ada's own TTS audio is likely still
+                # coming back through the mic, final Results are dropped here,
+                # pre-parse. VAD events drive barge-in and always pass.
+                if suppress_results is not None and suppress_results():
+                    continue
+
             try:
-                data = json.loads(msg.data)
-            except (json.JSONDecodeError, TypeError):
+                data = orjson.loads(raw)
+            except (orjson.JSONDecodeError, TypeError):
                 continue
 
             # Guard: Deepgram always sends dicts, but be defensive
@@ -185,19 +337,29 @@ class STTClient:
                 continue
 
             # ── Final transcript ──────────────────────────────────────────────
-            alternatives = data.get("channel", {}).get("alternatives", [])
+            # Step through the payload with early exits — no {} / [] default
+            # allocations, and nothing past the first missing level is read.
+            # The prefilter means is_final is effectively always true here,
+            # but keep the gate for the space-variant edge cases.
+            if not data.get("is_final", False):
+                continue
+            channel = data.get("channel")
+            if not channel:
+                continue
+            alternatives = channel.get("alternatives")
             if not alternatives:
                 continue
-
-            transcript = alternatives[0].get("transcript", "").strip()
-            confidence = alternatives[0].get("confidence", 0.0)
-            is_final = data.get("is_final", False)
-
-            if not (transcript and is_final):
+            alt = alternatives[0]
+            transcript = alt.get("transcript", "").strip()
+            if not transcript:
                 continue
+            confidence = alt.get("confidence", 0.0)
 
-            # Filter noise: too low confidence or too few words
-            word_count = len(transcript.split())
+            # Filter noise: too low confidence or too few words.
+            # count(" ") is one C-level scan; split() would allocate a list of
+            # every token just to take its length. The transcript is stripped
+            # and single-spaced, so spaces+1 is the word count.
+            word_count = transcript.count(" ") + 1
             if confidence < MIN_CONFIDENCE or word_count < MIN_WORDS:
                 print(
                     f"STT filtered: {transcript!r} "
@@ -4,6 +4,7 @@ from collections.abc import AsyncIterator
 
 import aiohttp
 import certifi
+import orjson
 
 _SSL_CTX = ssl.create_default_context(cafile=certifi.where())
 
@@ -15,6 +16,47 @@ class TTSClient:
         self.api_key = os.getenv("ELEVENLABS_API_KEY", "").strip()
         self.voice_id = os.getenv("ELEVENLABS_VOICE_ID", "pNInz6obpgDQGcFmaJgB")  # Adam
         self.enabled = bool(self.api_key)
+        # Everything but the text is identical across requests — build the
+        # URL, headers, and voice settings once instead of per utterance.
+        # pcm_22050 = 22050 Hz, 16-bit signed LE, mono — no MP3 encoder silence
+        self._url = f"{ELEVENLABS_API_URL}/{self.voice_id}/stream?output_format=pcm_22050"
+        self._headers = {
+            "xi-api-key": self.api_key,
+            "Content-Type": "application/json",
+            "Accept": "audio/mpeg",
+        }
+        self._voice_settings = {
+            "stability": 0.35,
+            "similarity_boost": 0.75,
+            "style": 0.3,
+            "use_speaker_boost": True,
+        }
+        # One HTTP session for every synthesis request — per-call sessions
+        # paid DNS + TLS handshake to ElevenLabs on each utterance, which sits
+        # directly on the time-to-first-audio path.
+        self._session: aiohttp.ClientSession | None = None
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    ssl=_SSL_CTX,
+                    keepalive_timeout=300,
+                    # Cache the ElevenLabs DNS answer so a resolver round trip
+                    # never lands on the time-to-first-audio path, and allow
+                    # enough parallel connections for sentence-level synthesis.
+                    use_dns_cache=True,
+                    ttl_dns_cache=600,
+                    limit_per_host=8,
+                )
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Release the pooled HTTP session (called on orchestrator cleanup)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def synthesize(self, text: str) -> bytes:
         """
@@ -27,10 +69,13 @@ class TTSClient:
             return b""
 
         try:
-            chunks: list[bytes] = []
+            # bytearray grows amortized in place; a list of chunks plus join
+            # would hold every chunk alive and copy the lot once more at the
+            # end. Utterances run to hundreds of KB of PCM.
+            buf = bytearray()
             async for chunk in self.stream(text):
-                chunks.append(chunk)
-            return b"".join(chunks)
+                buf += chunk
+            return bytes(buf)
         except Exception as e:
             print(f"TTS error: {e}")
             return b""
@@ -44,27 +89,23 @@ class TTSClient:
         if not self.enabled or not text.strip():
             return
 
-        # pcm_22050 = 22050 Hz, 16-bit signed LE, mono — no MP3 encoder silence
-        url = f"{ELEVENLABS_API_URL}/{self.voice_id}/stream?output_format=pcm_22050"
-        headers = {
-            "xi-api-key": self.api_key,
-            "Content-Type": "application/json",
-            "Accept": "audio/mpeg",
-        }
-        payload = {
+        # orjson over aiohttp's stdlib-json `json=` kwarg; Content-Type is
+        # already set in the cached headers.
+        body = orjson.dumps({
             "text": text,
             "model_id": "eleven_v3",
-            "voice_settings": {
-                "stability": 0.35,
-                "similarity_boost": 0.75,
-                "style": 0.3,
-                "use_speaker_boost": True,
-            },
-        }
-        connector = aiohttp.TCPConnector(ssl=_SSL_CTX)
-        async with aiohttp.ClientSession(connector=connector) as session:
-            async with session.post(url, headers=headers, json=payload) as resp:
-                resp.raise_for_status()
-                async for chunk in resp.content.iter_chunked(8192):
-                    if chunk:
-                        yield chunk
+            "voice_settings": self._voice_settings,
+        })
+        session = await self._ensure_session()
+        async with session.post(self._url, headers=self._headers, data=body) as resp:
+            resp.raise_for_status()
+            # Yield the first bytes with a small read so playback starts the
+            # moment ElevenLabs produces audio, then switch to 16 KB reads —
+            # at 44.1 KB/s of PCM, bigger chunks halve the number of
+            # read/yield/WS-send round trips with no audible latency cost.
+            first = await resp.content.read(4096)
+            if first:
+                yield first
+            async for chunk in resp.content.iter_chunked(16384):
+                if chunk:
+                    yield chunk
@@ -25,14 +25,44 @@ const tex = new TeX({
   ],
 });
 
-const svg = new SVG({ fontCache: "none" });
+// "local" emits each glyph once in <defs> and references it via <use>,
+// shrinking the SVG; the Python side resolves <use> against its glyph cache.
+const svg = new SVG({ fontCache: "local" });
 const html = mathjax.document("", { InputJax: tex, OutputJax: svg });
 
 app.get("/health", (_req, res) => {
   res.json({ status: "ok" });
 });
 
+function renderOne(latex, display) {
+  const node = html.convert(latex, {
+    display,
+    em: 16,
+    ex: 8,
+    containerWidth: 1200,
+  });
+  return adaptor.outerHTML(node);
+}
+
 app.post("/mathjax", (req, res) => {
+  // Batch form: { items: [{ latex, display? }, ...] } → { results: [...] }.
+  // One POST amortizes HTTP/JSON overhead across N expressions.
+  if (Array.isArray(req.body?.items)) {
+    const results = req.body.items.map((item) => {
+      const latex = typeof item?.latex === "string" ? item.latex.trim() : "";
+      if (!latex) {
+        return { error: "Missing 'latex' string in batch item." };
+      }
+      try {
+        return { svg: renderOne(latex, item?.display !== false) };
+      } catch (err) {
+        const message = err instanceof Error ? err.message : "Failed to render LaTeX";
+        return { error: message };
+      }
+    });
+    return res.json({ results });
+  }
+
   const latex = typeof req.body?.latex === "string" ? req.body.latex.trim() : "";
   const display = req.body?.display !== false;
 
@@ -41,13 +71,7 @@ app.post("/mathjax", (req, res) => {
   }
 
   try {
-    const node = html.convert(latex, {
-      display,
-      em: 16,
-      ex: 8,
-      containerWidth: 1200,
-    });
-    const svgText = adaptor.outerHTML(node);
+    const svgText = renderOne(latex, display);
     return res.type("image/svg+xml").send(svgText);
   } catch (err) {
     const message = err instanceof Error ? err.message : "Failed to render LaTeX";
@@ -0,0 +1,53 @@
+// PCM capture worklet for the STT microphone path.
+//
+// Receives 128-sample Float32 render quanta on the audio thread, converts to
+// 16-bit signed LE PCM, and posts ~50ms frames to the main thread as
+// transferable ArrayBuffers. Raw PCM lets Deepgram skip the Opus decode on
+// its side and keeps the backend ingress a pure byte copy — no webm container
+// parsing anywhere.
+//
+// Protocol: the main thread posts "flush" when the mic stops; the worklet
+// posts any buffered remainder followed by the string "flushed" so audio_stop
+// is only sent after the final samples are on the wire.
+
+const FRAME_SAMPLES = 800; // 50ms at 16 kHz
+
+class PcmCaptureProcessor extends AudioWorkletProcessor {
+  constructor() {
+    super();
+    this.buffer = new Int16Array(FRAME_SAMPLES);
+    this.offset = 0;
+    this.port.onmessage = (e) => {
+      if (e.data === "flush") {
+        this.flush();
+        this.port.postMessage("flushed");
+      }
+    };
+  }
+
+  flush() {
+    if (this.offset === 0) return;
+    const out = this.buffer.slice(0, this.offset);
+    this.port.postMessage(out.buffer, [out.buffer]);
+    this.offset = 0;
+  }
+
+  process(inputs) {
+    const channel = inputs[0] && inputs[0][0];
+    if (!channel) return true;
+
+    for (let i = 0; i < channel.length; i++) {
+      const s = Math.max(-1, Math.min(1, channel[i]));
+      this.buffer[this.offset++] = s < 0 ? s * 0x8000 : s * 0x7fff;
+      if (this.offset === FRAME_SAMPLES) {
+        const out = this.buffer;
+        this.port.postMessage(out.buffer, [out.buffer]);
+        this.buffer = new Int16Array(FRAME_SAMPLES);
+        this.offset = 0;
+      }
+    }
+    return true;
+  }
+}
+
+registerProcessor("pcm-capture", PcmCaptureProcessor);
@@ -22,6 +22,7 @@ interface TutorSessionState {
   startSession: () => void;
   endSession: () => void;
   send: (msg: ClientMessage) => void;
+  sendAudioChunk: (chunk: ArrayBuffer) => void;
   sendTranscript: (text: string) => void;
   setAdaSpeaking: (val: boolean) => void;
   _handleServerMessage: (msg: ServerMessage) => void;
@@ -108,6 +109,12 @@ export const useTutorSession = create<TutorSessionState>((set, get) => {
     ws?.send(msg);
   },
 
+  sendAudioChunk: (chunk: ArrayBuffer) => {
+    // Binary frame — skips the base64 + JSON encode of the audio_data path.
+    const { ws } = get();
+    ws?.sendAudio(chunk);
+  },
+
   sendTranscript: (text: string) => {
     const trimmed = text.trim();
     if (!trimmed) return;
@@ -149,6 +156,11 @@ export const useTutorSession = create<TutorSessionState>((set, get) => {
         audioPlayer.enqueue(msg.data);
         break;
 
+      case "audio_chunk_bin":
+        set({ adaSpeaking: true });
+        audioPlayer.enqueueBytes(msg.data);
+        break;
+
       case "strokes":
         useWhiteboard.getState().setIncomingStrokes(msg.strokes);
         break;
@@ -3,7 +3,14 @@
 import { useCallback, useRef, useState } from "react";
 import { useTutorSession } from "./useTutorSession";
 
-// Preferred mime type — webm/opus is supported in Chrome, Firefox, and Edge.
+// Primary capture path: AudioWorklet posting raw PCM16 frames. Deepgram
+// ingests linear16 without an Opus decode, and the backend just forwards the
+// bytes — no webm container anywhere. MediaRecorder webm/opus remains as the
+// fallback for browsers without AudioWorklet support.
+const TARGET_SAMPLE_RATE = 16000;
+const WORKLET_URL = "/pcm-capture-worklet.js";
+
+// Fallback mime type — webm/opus is supported in Chrome, Firefox, and Edge.
 // The backend tells Deepgram to expect encoding=opus&container=webm.
 const PREFERRED_MIME = "audio/webm;codecs=opus";
 const FALLBACK_MIME = "audio/webm";
@@ -15,12 +22,32 @@ function getSupportedMimeType(): string {
   return ""; // let the browser choose
 }
 
+function supportsWorkletCapture(): boolean {
+  return (
+    typeof AudioContext !== "undefined" &&
+    typeof AudioWorkletNode !== "undefined"
+  );
+}
+
 export function useVoicePipeline() {
   const [isListening, setIsListening] = useState(false);
   const recorderRef = useRef<MediaRecorder | null>(null);
   const streamRef = useRef<MediaStream | null>(null);
+  const audioCtxRef = useRef<AudioContext | null>(null);
+  const workletRef = useRef<AudioWorkletNode | null>(null);
   const stopRequestedRef = useRef(false);
-  const { send, isConnected } = useTutorSession();
+  const { send, sendAudioChunk, isConnected } = useTutorSession();
+
+  const releaseCapture = useCallback(() => {
+    streamRef.current?.getTracks().forEach((t) => t.stop());
+    workletRef.current?.disconnect();
+    audioCtxRef.current?.close().catch(() => {});
+    recorderRef.current = null;
+    streamRef.current = null;
+    audioCtxRef.current = null;
+    workletRef.current = null;
+    stopRequestedRef.current = false;
+  }, []);
 
   const startListening = useCallback(async () => {
     if (isListening || !isConnected) return;
@@ -35,23 +62,66 @@ export function useVoicePipeline() {
       });
       streamRef.current = stream;
 
+      if (supportsWorkletCapture()) {
+        // Worklet failures (404 on the module after a stale deploy, CSP,
+        // AudioContext limits) must not cost the student voice input — on
+        // any error tear down the partial graph and fall through to the
+        // MediaRecorder path below, which only needs the mic stream.
+        try {
+          // Ask for 16 kHz directly; browsers that can't run the graph at that
+          // rate fall back to their native rate, which we report to the backend
+          // so the Deepgram URL carries the true sample_rate.
+          const ctx = new AudioContext({ sampleRate: TARGET_SAMPLE_RATE });
+          audioCtxRef.current = ctx;
+          await ctx.audioWorklet.addModule(WORKLET_URL);
+          const source = ctx.createMediaStreamSource(stream);
+          const node = new AudioWorkletNode(ctx, "pcm-capture");
+
+          node.port.onmessage = (e: MessageEvent) => {
+            if (e.data === "flushed") {
+              // Final samples are on the wire — now it's safe to close the stream.
+              if (stopRequestedRef.current) {
+                send({ type: "audio_stop" });
+              }
+              releaseCapture();
+              return;
+            }
+            sendAudioChunk(e.data as ArrayBuffer);
+          };
+
+          // Keep forwarding mic frames even while Ada is speaking so Deepgram
+          // can fire SpeechStarted immediately when the student talks over Ada.
+          // Echo suppression is handled by browser audio constraints + backend
+          // confidence/echo filters.
+          source.connect(node);
+          workletRef.current = node;
+
+          // Tell the backend to open a Deepgram connection for raw PCM.
+          send({
+            type: "audio_start",
+            encoding: "linear16",
+            sample_rate: ctx.sampleRate,
+          });
+          setIsListening(true);
+          return;
+        } catch (err) {
+          console.warn("AudioWorklet capture failed, using MediaRecorder:", err);
+          workletRef.current?.disconnect();
+          audioCtxRef.current?.close().catch(() => {});
+          audioCtxRef.current = null;
+          workletRef.current = null;
+        }
+      }
+
+      // ── MediaRecorder fallback (webm/opus) ──────────────────────────────
       const mimeType = getSupportedMimeType();
       const recorder = new MediaRecorder(stream, mimeType ? { mimeType } : undefined);
 
       recorder.ondataavailable = async (e) => {
         if (e.data.size === 0) return;
-
-        // Keep forwarding mic chunks even while Ada is speaking so Deepgram can
-        // fire SpeechStarted immediately when the student talks over Ada.
-        // Echo suppression is handled by browser audio constraints + backend
-        // confidence/echo filters.
-
-        // Convert Blob → ArrayBuffer → base64 and send to backend
+        // Send the chunk as an opcode-prefixed binary frame — no base64.
         const buffer = await e.data.arrayBuffer();
-        const bytes = new Uint8Array(buffer);
-        let binary = "";
-        for (let i = 0; i < bytes.length; i++) binary += String.fromCharCode(bytes[i]);
-        send({ type: "audio_data", data: btoa(binary) });
+        sendAudioChunk(buffer);
       };
 
       recorder.onstop = () => {
@@ -59,14 +129,11 @@ export function useVoicePipeline() {
         if (stopRequestedRef.current) {
           send({ type: "audio_stop" });
         }
-        streamRef.current?.getTracks().forEach((t) => t.stop());
-        recorderRef.current = null;
-        streamRef.current = null;
-        stopRequestedRef.current = false;
+        releaseCapture();
       };
 
       // Tell the backend to open a Deepgram connection
-      send({ type: "audio_start" });
+      send({ type: "audio_start", encoding: "webm-opus" });
 
       recorder.start(CHUNK_INTERVAL_MS);
       recorderRef.current = recorder;
@@ -74,14 +141,20 @@ export function useVoicePipeline() {
     } catch (err) {
       console.error("Microphone access denied:", err);
     }
-  }, [isListening, isConnected, send]);
+  }, [isListening, isConnected, send, sendAudioChunk, releaseCapture]);
 
   const stopListening = useCallback(() => {
     if (!isListening) return;
     stopRequestedRef.current = true;
-    // Flush buffered audio before stop to avoid clipping the utterance tail.
-    recorderRef.current?.requestData();
-    recorderRef.current?.stop();
+    if (workletRef.current) {
+      // Ask the worklet to post its buffered tail; teardown happens when the
+      // "flushed" ack comes back so the utterance end is never clipped.
+      workletRef.current.port.postMessage("flush");
+    } else {
+      // Flush buffered audio before stop to avoid clipping the utterance tail.
+      recorderRef.current?.requestData();
+      recorderRef.current?.stop();
+    }
     setIsListening(false);
   }, [isListening]);
 
@@ -33,26 +33,32 @@ class AudioPlayer {
     if (ctx.state === "suspended") ctx.resume().catch(() => {});
   }
 
+  /** Legacy path: base64 string from a JSON audio_chunk message. */
   enqueue(base64Audio: string): void {
     const binary = atob(base64Audio);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+    this.enqueueBytes(bytes);
+  }
 
+  /** Raw PCM bytes from a binary WebSocket frame — no base64 decode. */
+  enqueueBytes(chunk: Uint8Array): void {
     // Prepend any carry-over byte from the previous odd-length chunk so that
     // 16-bit sample boundaries are always respected across chunk edges.
     let raw: Uint8Array;
     if (this._carryByte !== null) {
-      raw = new Uint8Array(binary.length + 1);
+      raw = new Uint8Array(chunk.length + 1);
       raw[0] = this._carryByte;
-      for (let i = 0; i < binary.length; i++) raw[i + 1] = binary.charCodeAt(i);
+      raw.set(chunk, 1);
       this._carryByte = null;
     } else {
-      raw = new Uint8Array(binary.length);
-      for (let i = 0; i < binary.length; i++) raw[i] = binary.charCodeAt(i);
+      raw = chunk;
     }
 
     // If the combined length is still odd, save the last byte for next time.
     if (raw.length % 2 !== 0) {
       this._carryByte = raw[raw.length - 1];
-      raw = raw.slice(0, raw.length - 1);
+      raw = raw.subarray(0, raw.length - 1);
     }
 
     const numSamples = raw.length / 2;
@@ -69,7 +75,9 @@ class AudioPlayer {
     // Parse 16-bit signed little-endian PCM synchronously — no encoder silence.
     const audioBuffer = ctx.createBuffer(1, numSamples, PCM_SAMPLE_RATE);
     const channelData = audioBuffer.getChannelData(0);
-    const view = new DataView(raw.buffer);
+    // raw may be a view into a larger buffer (binary frame minus its opcode),
+    // so respect byteOffset when constructing the DataView.
+    const view = new DataView(raw.buffer, raw.byteOffset, raw.byteLength);
     for (let i = 0; i < numSamples; i++) {
       channelData[i] = view.getInt16(i * 2, true) / 32768;
     }
@@ -1,4 +1,4 @@
-import type { ClientMessage, ServerMessage } from "@/types";
+import type { BatchMessage, ClientMessage, ServerMessage } from "@/types";
 
 type MessageHandler = (msg: ServerMessage) => void;
 type OpenHandler = () => void;
@@ -7,6 +7,11 @@ type CloseHandler = (code: number, reason: string) => void;
 const RECONNECT_DELAY_MS = 2000;
 const MAX_RECONNECT_ATTEMPTS = 5;
 
+// Binary frame opcode shared with the backend: 0x01 + raw audio bytes.
+// Used for TTS PCM downstream and mic webm/opus chunks upstream — avoids
+// base64 inflation and JSON encode/decode on every audio frame.
+const AUDIO_FRAME_OPCODE = 0x01;
+
 export class TutorWebSocket {
   private url: string;
   private ws: WebSocket | null = null;
@@ -40,6 +45,15 @@ export class TutorWebSocket {
     }
   }
 
+  /** Send a raw audio chunk as an opcode-prefixed binary frame. */
+  sendAudio(chunk: ArrayBuffer): void {
+    if (this.ws?.readyState !== WebSocket.OPEN) return;
+    const framed = new Uint8Array(chunk.byteLength + 1);
+    framed[0] = AUDIO_FRAME_OPCODE;
+    framed.set(new Uint8Array(chunk), 1);
+    this.ws.send(framed);
+  }
+
   onOpen(handler: OpenHandler): void {
     this.openHandler = handler;
   }
@@ -51,6 +65,7 @@ export class TutorWebSocket {
   private _open(): void {
     try {
       this.ws = new WebSocket(this.url);
+      this.ws.binaryType = "arraybuffer";
 
       this.ws.onopen = () => {
         console.log("WebSocket connected:", this.url);
@@ -60,8 +75,23 @@ export class TutorWebSocket {
 
       this.ws.onmessage = (event) => {
         try {
-          const msg = JSON.parse(event.data) as ServerMessage;
-          this.messageHandler(msg);
+          if (event.data instanceof ArrayBuffer) {
+            const bytes = new Uint8Array(event.data);
+            if (bytes[0] === AUDIO_FRAME_OPCODE) {
+              this.messageHandler({
+                type: "audio_chunk_bin",
+                data: bytes.subarray(1),
+              });
+            }
+            return;
+          }
+          const msg = JSON.parse(event.data) as ServerMessage | BatchMessage;
+          if (msg.type === "batch") {
+            // Backend coalesces bursty sends into one frame — unwrap in order.
+            for (const item of msg.items) this.messageHandler(item);
+          } else {
+            this.messageHandler(msg);
+          }
         } catch (err) {
           console.error("Failed to parse server message:", err);
         }
@@ -84,6 +84,10 @@ export interface BoardSnapshotMessage {
 
 export interface AudioStartMessage {
   type: "audio_start";
+  // Capture encoding the client is about to stream. "linear16" = raw PCM16
+  // from the AudioWorklet path; omitted/"webm-opus" = MediaRecorder fallback.
+  encoding?: "linear16" | "webm-opus";
+  sample_rate?: number; // actual AudioContext rate (linear16 only)
 }
 
 export interface AudioDataMessage {
@@ -122,7 +126,14 @@ export interface SpeechTextMessage {
 
 export interface AudioChunkMessage {
   type: "audio_chunk";
-  data: string; // base64-encoded audio bytes
+  data: string; // base64-encoded audio bytes (legacy JSON path)
+}
+
+// Synthesized locally from a binary WebSocket frame (0x01 opcode + raw PCM).
+// Never appears as JSON on the wire.
+export interface AudioChunkBinaryMessage {
+  type: "audio_chunk_bin";
+  data: Uint8Array;
 }
 
 export interface StrokesMessage {
@@ -164,6 +175,7 @@ export type ServerMessage =
   | ConnectedMessage
   | SpeechTextMessage
   | AudioChunkMessage
+  | AudioChunkBinaryMessage
   | StrokesMessage
   | BoardActionMessage
   | TranscriptInterimMessage
@@ -171,3 +183,11 @@ export type ServerMessage =
   | StateUpdateMessage
   | ScrollBoardMessage
   | ErrorMessage;
+
+// Transport envelope: the backend coalesces bursts of messages (audio chunks,
+// stroke batches) into one frame. Unwrapped in TutorWebSocket, so handlers
+// only ever see the inner ServerMessages.
+export interface BatchMessage {
+  type: "batch";
+  items: ServerMessage[];
+}